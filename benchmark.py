@@ -0,0 +1,181 @@
+"""Generation benchmark across scale factors, with regression thresholds.
+
+Each scale factor runs in a fresh interpreter so timings and memory
+high-water marks do not bleed between sizes. For every generate_* stage
+and for every table's JSON write we record wall time, row count and the
+process peak RSS after the step. Results are written as JSON; with a
+baseline file, any step slower than baseline * (1 + threshold) (and by
+more than --min-delta seconds, to ignore noise on tiny stages) fails the
+run. Every stage is seeded (seeded2.seed_stage, --seed) so baseline and
+comparison runs time the same data.
+
+    python benchmark.py --scales 1 2 4 --update-baseline
+    python benchmark.py --scales 1 2 4 --baseline benchmark_baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+DEFAULT_SCALES = [1, 2, 4]
+DEFAULT_BASELINE = 'benchmark_baseline.json'
+DEFAULT_OUTPUT = 'benchmark_results.json'
+DEFAULT_SEED = 42
+
+def peak_rss_mb():
+    """Process peak resident set size so far, in MiB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def run_scale(scale, trace_memory=False, seed=DEFAULT_SEED):
+    """Time every generation stage and table write at one scale factor (in this process)"""
+    import seeded2
+
+    seeded2.scale_factor = scale
+    seeded2.data.clear()
+    if trace_memory:
+        tracemalloc.start()
+
+    # Build Faker before the first stage is timed
+    seeded2.fake.build()
+    stages = {}
+    run_start = time.perf_counter()
+    for table_name, generate, _ in seeded2.STAGES:
+        if trace_memory:
+            tracemalloc.reset_peak()
+        seeded2.seed_stage(seed, table_name)
+        start = time.perf_counter()
+        generate()
+        stages[table_name] = {
+            'seconds': round(time.perf_counter() - start, 4),
+            'rows': len(seeded2.data[table_name]),
+            'peak_rss_mb': peak_rss_mb(),
+        }
+        if trace_memory:
+            stages[table_name]['tracemalloc_peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 1)
+    generate_seconds = time.perf_counter() - run_start
+
+    writes = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for table_name, table_data in seeded2.data.items():
+            start = time.perf_counter()
+            filename = seeded2.write_table(table_name, table_data, output_dir)
+            writes[table_name] = {
+                'seconds': round(time.perf_counter() - start, 4),
+                'bytes': os.path.getsize(filename),
+            }
+    write_seconds = time.perf_counter() - run_start - generate_seconds
+
+    return {
+        'scale': scale,
+        'seed': seed,
+        'generate_seconds': round(generate_seconds, 3),
+        'write_seconds': round(write_seconds, 3),
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': stages,
+        'writes': writes,
+    }
+
+def run_scale_subprocess(scale, trace_memory=False, seed=DEFAULT_SEED):
+    """Run one scale factor in a fresh interpreter and return its result"""
+    command = [sys.executable, os.path.abspath(__file__), '--worker', str(scale), '--seed', str(seed)]
+    if trace_memory:
+        command.append('--trace-memory')
+    completed = subprocess.run(
+        command, capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    return json.loads(completed.stdout)
+
+def compare(results, baseline, threshold, min_delta):
+    """List steps that regressed beyond the threshold against the baseline"""
+    regressions = []
+    for scale, run in results['runs'].items():
+        base_run = baseline['runs'].get(scale)
+        if base_run is None or base_run.get('seed') != run['seed']:
+            continue
+        steps = [('generate', name, step) for name, step in run['stages'].items()]
+        steps += [('write', name, step) for name, step in run['writes'].items()]
+        for kind, name, step in steps:
+            base_step = base_run['stages' if kind == 'generate' else 'writes'].get(name)
+            if base_step is None:
+                continue
+            limit = base_step['seconds'] * (1 + threshold)
+            if step['seconds'] > limit and step['seconds'] - base_step['seconds'] > min_delta:
+                regressions.append(
+                    f"scale {scale} {kind} {name}: {step['seconds']:.3f}s vs baseline {base_step['seconds']:.3f}s"
+                )
+        if run['peak_rss_mb'] > base_run['peak_rss_mb'] * (1 + threshold):
+            regressions.append(
+                f"scale {scale} peak RSS: {run['peak_rss_mb']} MiB vs baseline {base_run['peak_rss_mb']} MiB"
+            )
+    return regressions
+
+def print_summary(results):
+    runs = list(results['runs'].values())
+    header = f"{'stage':<28}" + ''.join(f"{'SF=' + format(run['scale'], 'g'):>12}" for run in runs)
+    print(header)
+    for table_name in runs[0]['stages']:
+        print(f"{table_name:<28}" + ''.join(f"{run['stages'][table_name]['seconds']:>11.3f}s" for run in runs))
+    print(f"{'(write all tables)':<28}" + ''.join(f"{run['write_seconds']:>11.3f}s" for run in runs))
+    print(f"{'(peak RSS MiB)':<28}" + ''.join(f"{run['peak_rss_mb']:>12}" for run in runs))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dataset generation across scale factors")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="where to write this run's results")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="stored results to compare against")
+    parser.add_argument('--update-baseline', action='store_true', help="store this run as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed slowdown, as a fraction (default 0.25)")
+    parser.add_argument('--min-delta', type=float, default=0.05, help="ignore slowdowns smaller than this many seconds")
+    parser.add_argument('--trace-memory', action='store_true', help="also record per-stage tracemalloc peaks (slower)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f"seed every stage with this (default {DEFAULT_SEED}); runs only compare at the same seed")
+    parser.add_argument('--worker', type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        json.dump(run_scale(args.worker, args.trace_memory, args.seed), sys.stdout)
+        sys.exit(0)
+
+    results = {
+        'created_at': datetime.now().isoformat(),
+        'host': platform.node(),
+        'python': platform.python_version(),
+        'runs': {},
+    }
+    for scale in args.scales:
+        print(f"Benchmarking scale factor {scale:g}...")
+        results['runs'][f"{scale:g}"] = run_scale_subprocess(scale, args.trace_memory, args.seed)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print_summary(results)
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        other_seed = [scale for scale, run in baseline['runs'].items() if run.get('seed') != args.seed]
+        if other_seed:
+            print(f"\nSkipping baseline scales {', '.join(other_seed)}: not recorded with seed {args.seed} "
+                  f"(rerun with --update-baseline)")
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        if regressions:
+            print(f"\n{len(regressions)} regressions beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
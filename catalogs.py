@@ -0,0 +1,308 @@
+"""Static catalogues the generators draw names, categories and SLA targets from.
+
+Plain data with no imports, so tools that only need the catalogues (or the
+generator's helpers) can load them without building Faker.
+"""
+
+# --------------------
+# Contact details
+# --------------------
+
+# Email domains for realistic email generation
+email_domains = ['gmail.com', 'outlook.com', 'yahoo.com', 'company.com', 'business.net', 'corp.org']
+
+# Phone number area codes
+area_codes = ['202', '212', '213', '214', '305', '312', '404', '415', '503', '617', '718', '832']
+
+# --------------------
+# Clients
+# --------------------
+
+industries_by_type = {
+    'enterprise': ['Aerospace', 'Automotive', 'Government', 'Energy', 'Telecommunications', 'Financial Services'],
+    'mid_market': ['Manufacturing', 'Insurance', 'Healthcare', 'Real Estate', 'Technology'],
+    'small_business': ['Retail', 'Food & Beverage', 'Construction', 'Hospitality'],
+    'startup': ['Technology', 'Biotechnology', 'Media', 'Education', 'Fintech']
+}
+
+countries = [
+    'United States', 'Canada', 'United Kingdom', 'Germany', 'France',
+    'Australia', 'Japan', 'Brazil', 'India', 'Mexico'
+]
+
+# --------------------
+# Vendors
+# --------------------
+
+vendor_types_names = {
+    'cloud_provider': [
+        'AOS Cloud', 'Azurian Cloud Services', 'Goggle Cloud Platform',
+        'IBM Nimbus', 'Orcale Cloud', 'DigitalOceanic', 'LinodeX', 'Vulturis'
+    ],
+    'payment_processor': [
+        'Stripee', 'PayPole', 'Squarix Payments', 'Adyant',
+        'Worldpayz', 'Authorize.NetX', 'Braintreee', 'Klarno'
+    ],
+    'software_vendor': [
+        'Microcraft', 'Orcale Systems', 'SAPhia Solutions',
+        'SalesForza', 'Adobix', 'Atlasian', 'ServiceNowo', 'Workdaze'
+    ],
+    'infrastructure_provider': [
+        'Cysco Systems', 'VMwere', 'Red Hatchet', 'Dockar Inc',
+        'HashyCorp', 'Kubernetix', 'Terrafirm', 'Ansiblee'
+    ],
+    'security_vendor': [
+        'CrowdStrik3', 'Palo Alto Netwerks', 'Symantix',
+        'McAfree', 'Fortanett', 'CheckPoynt', 'Splonq', 'Oktra'
+    ]
+}
+
+# --------------------
+# Users
+# --------------------
+
+departments_by_role = {
+    'incident_manager': ['Operations', 'IT Support', 'Technical Operations'],
+    'technical_support': ['Technical Support', 'Engineering', 'IT Operations'],
+    'account_manager': ['Account Management', 'Customer Success', 'Business Development'],
+    'executive': ['Executive', 'Management', 'Leadership'],
+    'system_administrator': ['IT Administration', 'System Operations', 'Infrastructure'],
+    'client_contact': lambda industry: [
+        f"{industry} Operations", f"{industry} IT", "Business Operations"
+    ],
+    'vendor_contact': lambda vendor_type: [
+        f"{vendor_type.replace('_', ' ').title()} Support",
+        "Technical Account Management", "Customer Success"
+    ]
+}
+
+# --------------------
+# Products
+# --------------------
+
+product_types_by_vendor = {
+    'cloud_provider': ['api_gateway', 'data_integration', 'monitoring_tool', 'backup_service'],
+    'payment_processor': ['payment_processing', 'api_gateway'],
+    'software_vendor': ['banking_system', 'reporting_platform', 'data_integration'],
+    'infrastructure_provider': ['monitoring_tool', 'security_service', 'backup_service'],
+    'security_vendor': ['security_service', 'monitoring_tool']
+}
+
+tech_terms = [
+    "Nova", "Orion", "Zenith", "Apex", "Nimbus", "Pulse", "Quantum",
+    "Vertex", "Horizon", "Stratus", "Vector", "Helix", "Axis",
+    "Catalyst", "Core", "Stream", "Fusion", "Lumen", "Echo", "Forge"
+]
+
+# --------------------
+# Infrastructure components
+# --------------------
+
+component_types_by_product = {
+    'payment_processing': ['payment_gateway', 'api_endpoint', 'database'],
+    'banking_system': ['database', 'api_endpoint', 'authentication_service'],
+    'api_gateway': ['api_endpoint', 'load_balancer', 'firewall'],
+    'data_integration': ['sftp_server', 'api_endpoint', 'database'],
+    'reporting_platform': ['database', 'api_endpoint', 'file_storage'],
+    'security_service': ['firewall', 'authentication_service', 'monitoring_system'],
+    'backup_service': ['file_storage', 'sftp_server', 'monitoring_system'],
+    'monitoring_tool': ['monitoring_system', 'api_endpoint', 'database']
+}
+
+cloud_regions = [
+    "aws-us-east-1", "aws-us-west-2", "gcp-europe-west3", 
+    "azure-centralus", "aws-ap-southeast-1"
+]
+
+datacenters = [
+    "NYC-DC1", "SFO-DC2", "LON-DC3", "FRA-DC4", "SGP-DC5"
+]
+
+# --------------------
+# SLA agreements
+# --------------------
+
+# Updated response times by tier (in minutes) - matching your specifications
+sla_response_times = {
+    'premium': {'P1': 15, 'P2': 60, 'P3': 240, 'P4': 1440},      # 15min, 1hr, 4hr, 24hr
+    'standard': {'P1': 60, 'P2': 240, 'P3': 1440, 'P4': 2880},   # 1hr, 4hr, 24hr, 48hr
+    'basic': {'P1': 240, 'P2': 1440, 'P3': 2880, 'P4': 7200}     # 4hr, 24hr, 48hr, 120hr
+}
+
+# Updated resolution times by tier (in hours) - P4 now has values
+sla_resolution_times = {
+    'premium': {'P1': 2, 'P2': 8, 'P3': 48, 'P4': 120},          # 2hr, 8hr, 48hr, 120hr
+    'standard': {'P1': 8, 'P2': 24, 'P3': 72, 'P4': 168},        # 8hr, 24hr, 72hr, 168hr (1 week)
+    'basic': {'P1': 24, 'P2': 72, 'P3': 240, 'P4': 336}          # 24hr, 72hr, 240hr, 336hr (2 weeks)
+}
+
+# Availability percentages by tier
+sla_availability_percentages = {
+    'premium': 99.9,
+    'standard': 99.5,
+    'basic': 99.0
+}
+
+# --------------------
+# Incidents
+# --------------------
+
+# Impact and urgency follow from severity
+impact_urgency_by_severity = {
+    'P1': ('critical', 'critical'),
+    'P2': ('high', 'high'),
+    'P3': ('medium', 'medium'),
+    'P4': ('low', 'low')
+}
+
+# Title catalog
+titles_by_component = {
+    'api_endpoint': {
+        'performance_issue': [
+            'High API Latency Detected', '5xx Error Spike on API', 'Rate Limit Saturation'
+        ],
+        'integration_failure': [
+            'API Connection Failed', 'Webhook Delivery Failures', 'OAuth Token Rejected'
+        ],
+        'system_outage': [
+            'API Unavailable', 'Routing Failure to API', 'DNS Resolution Failure for API'
+        ],
+    },
+    'payment_gateway': {
+        'vendor_issue': [
+            'Payment Authorization Failures', 'High Decline Rates from Processor', 'Settlement Delay from Vendor'
+        ],
+        'performance_issue': [
+            'Gateway Timeout Errors', 'Increased Transaction Latency', 'Intermittent Capture Failures'
+        ],
+        'system_outage': [
+            'Gateway Unreachable', 'Processor Endpoint Down', 'Critical Gateway Connectivity Loss'
+        ],
+    },
+    'database': {
+        'data_update': [
+            'Schema Migration Error', 'Record Corruption Detected', 'Write Conflicts Observed'
+        ],
+        'performance_issue': [
+            'Replication Lag High', 'Connection Pool Exhausted', 'Deadlocks Detected'
+        ],
+        'system_outage': [
+            'Primary Database Unavailable', 'Failover Did Not Trigger', 'Storage Volume Not Mounted'
+        ],
+    },
+    'load_balancer': {
+        'system_outage': [
+            'LB Health Checks Failing', 'VIP Not Reachable', 'Listener Crash on LB'
+        ],
+        'performance_issue': [
+            'Uneven Traffic Distribution', 'SSL Termination Failures', 'Session Stickiness Broken'
+        ],
+    },
+    'firewall': {
+        'security_breach': [
+            'Unusual Port Scans Detected', 'Unauthorized Access Attempt Blocked', 'Inbound Traffic Spike'
+        ],
+        'integration_failure': [
+            'Firewall Blocking Legitimate Traffic', 'Rule Misconfiguration', 'Outbound Port Blocked'
+        ],
+    },
+    'authentication_service': {
+        'security_breach': [
+            'Multiple Failed Login Attempts', 'Suspicious SSO Activity', 'Brute Force Attempt Detected'
+        ],
+        'client_support': [
+            'SSO Login Failures', 'Token Expiry Mismatch', 'MFA Provider Timeout'
+        ],
+    },
+    'sftp_server': {
+        'data_update': [
+            'SFTP Upload Permission Denied', 'Key Exchange Failure', 'Partial Transfers Detected'
+        ],
+        'integration_failure': [
+            'SFTP Connection Timeout', 'Host Key Mismatch', 'Batch Job Could Not Connect to SFTP'
+        ],
+    },
+    'file_storage': {
+        'data_update': [
+            'File Corruption Detected', 'Checksum Mismatch on Object', 'Stale Snapshot Restored'
+        ],
+        'performance_issue': [
+            'Object Store Latency', 'Slow Reads from Storage', 'Write Throughput Degradation'
+        ],
+    },
+    'monitoring_system': {
+        'performance_issue': [
+            'Dashboard Query Latency', 'Timeseries Backfill Lag', 'Indexing Queue Backlog', 
+            'Alert Flood from Multiple Sources', 'Agent Offline Across Nodes', 'Metrics Ingestion Delay'
+        ],
+    },
+}
+
+fallback_titles = {
+    'performance_issue': ['Slow Response Times', 'High Latency Detected', 'Resource Exhaustion'],
+    'system_outage': ['Service Unavailable', 'Network Connectivity Lost', 'Complete System Down'],
+    'integration_failure': ['Third-party Service Down', 'Data Flow Interrupted', 'API Connection Failed'],
+    'security_breach': ['Unauthorized Access Detected', 'Suspicious Activity', 'Data Breach Alert'],
+    'data_update': ['Data Sync Failed', 'Database Update Error', 'Record Corruption'],
+    'client_support': ['Login Issues', 'Access Configuration Issue', 'User Provisioning Error'],
+    'vendor_issue': ['Vendor Service Outage', 'Third-party Performance Issues', 'Vendor Communication Error'],
+}
+
+# --------------------
+# Communications and escalations
+# --------------------
+
+recipient_type_by_role = {
+    'client_contact': 'client',
+    'incident_manager': 'internal_team',
+    'technical_support': 'internal_team',
+    'account_manager': 'internal_team',
+    'executive': 'executive',
+    'system_administrator': 'internal_team',
+    'vendor_contact': 'vendor'
+}
+
+escalation_level_by_role = {
+    'technical_support': 'technical',
+    'incident_manager': 'management',
+    'account_manager': 'management',
+    'executive': 'executive',
+    'vendor_contact': 'vendor'
+}
+
+# --------------------
+# Knowledge base articles
+# --------------------
+
+# Incident category -> KB baseline category
+incident_category_map = {
+    'client_onboarding': 'client_onboarding',
+    'client_support': 'incident_response',
+    'client_escalation': 'sla_management',
+    'data_update': 'data_synchronization',
+    'system_outage': 'system_outages',
+    'security_breach': 'security_incidents',
+    'performance_issue': 'performance_degradation',
+    'integration_failure': 'third_party_integrations',
+    'vendor_issue': 'vendor_escalations'
+}
+
+# Component type -> More specific KB category
+component_category_map = {
+    'sftp_server': 'file_transfer_problems',
+    'api_endpoint': 'api_integration',
+    'database': 'database_issues',
+    'load_balancer': 'network_connectivity',
+    'firewall': 'network_connectivity',
+    'authentication_service': 'authentication_issues',
+    'payment_gateway': 'payment_processing',
+    'file_storage': 'backup_recovery',
+    'monitoring_system': 'monitoring_alerts'
+}
+
+kb_categories = [
+    'authentication_issues', 'payment_processing', 'api_integration',
+    'data_synchronization', 'system_outages', 'performance_degradation',
+    'security_incidents', 'backup_recovery', 'user_management',
+    'billing_issues', 'compliance_procedures', 'vendor_escalations'
+]
@@ -0,0 +1,73 @@
+"""Per-stage checkpoints so an interrupted generation run can resume.
+
+After each stage the new table is pickled to <checkpoint_dir>/<table>.pkl
+together with the state of both random generators (the `random` module and
+Faker's), then manifest.json is rewritten to list it as completed. Both files
+are written to a temporary name and moved into place, so a run killed
+mid-write leaves the previous checkpoint intact; the manifest is only updated
+once the table file is complete.
+
+Stages only ever add their own table to `data`, so restoring the completed
+tables and the RNG state saved after the last of them puts the generator in
+exactly the state an uninterrupted run would have reached.
+"""
+import json
+import os
+import pickle
+
+MANIFEST = 'manifest.json'
+
+def table_file(checkpoint_dir, table_name):
+    return os.path.join(checkpoint_dir, f"{table_name}.pkl")
+
+def atomic_write(path, payload):
+    """Write payload to path via a temporary file and rename"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def load_manifest(checkpoint_dir):
+    """The checkpoint manifest, or None if nothing has been checkpointed yet"""
+    path = os.path.join(checkpoint_dir, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def start(checkpoint_dir, parameters):
+    """Open a checkpoint directory; returns the manifest, resumed or new.
+
+    A checkpoint written with different parameters (e.g. another scale factor)
+    cannot be resumed and raises ValueError rather than mixing the two runs.
+    """
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    manifest = load_manifest(checkpoint_dir)
+    if manifest is None:
+        manifest = {'parameters': parameters, 'completed': []}
+    elif manifest['parameters'] != parameters:
+        raise ValueError(
+            f"checkpoint in {checkpoint_dir} was written with {manifest['parameters']}, "
+            f"not {parameters}; remove it or choose another directory"
+        )
+    return manifest
+
+def save_stage(checkpoint_dir, manifest, table_name, table, rng_state):
+    """Checkpoint one finished stage's table and the RNG state after it"""
+    payload = pickle.dumps({'table': table, 'rng_state': rng_state}, protocol=pickle.HIGHEST_PROTOCOL)
+    atomic_write(table_file(checkpoint_dir, table_name), payload)
+    manifest['completed'].append(table_name)
+    atomic_write(os.path.join(checkpoint_dir, MANIFEST), json.dumps(manifest, indent=2).encode('utf-8'))
+
+def restore(checkpoint_dir, manifest):
+    """Load every completed table; returns ({table: rows}, RNG state after the last one)"""
+    tables = {}
+    rng_state = None
+    for table_name in manifest['completed']:
+        with open(table_file(checkpoint_dir, table_name), 'rb') as f:
+            saved = pickle.load(f)
+        tables[table_name] = saved['table']
+        rng_state = saved['rng_state']
+    return tables, rng_state
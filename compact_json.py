@@ -0,0 +1,114 @@
+"""Dictionary-encoded JSON for generated tables.
+
+The regular output repeats every column name in every row, and status-like
+columns (severity, status, impact, category, update_type, ...) repeat the
+same few strings across the whole table. The compact form writes them once
+in a header and each row as a positional array:
+
+    {"key": "incident_id",
+     "columns": ["incident_id", "title", "severity", ...],
+     "enums": {"severity": ["P3", "P1", "P2", "P4"], ...},
+     "rows": [
+    ["1", "Database connection pool exhausted", 0, ...],
+    ...
+    ]}
+
+A column is dictionary-encoded when all its values are strings (or null)
+and it has few distinct values; its cells hold the index into the column's
+dictionary, nulls stay null. decode() rebuilds the {id: row} dict the
+generator keeps in memory, in the original row and column order.
+
+    python compact_json.py DATA_DIR [--output-dir DIR]   # convert a dataset
+"""
+import argparse
+import json
+import os
+
+SUFFIX = '.compact.json'
+
+# Columns with more distinct values than this (or than half the rows) are stored as is
+MAX_ENUM_VALUES = 255
+
+def table_path(table_name, data_dir):
+    """Path of a table's compact JSON file"""
+    return os.path.join(data_dir, f"{table_name}{SUFFIX}")
+
+def enum_values(values, limit):
+    """Distinct non-null values in first-seen order, or None if they are not a small set of strings"""
+    distinct = {}
+    for value in values:
+        if value is None or value in distinct:
+            continue
+        if not isinstance(value, str) or len(distinct) == limit:
+            return None
+        distinct[value] = len(distinct)
+    return list(distinct)
+
+def encode(table):
+    """The compact form of a {id: row} table whose rows all have the same columns, the id first"""
+    rows = list(table.values())
+    if not rows:
+        return {'key': None, 'columns': [], 'enums': {}, 'rows': []}
+    columns = list(rows[0])
+    key = columns[0]
+    for row_id, row in table.items():
+        if row[key] != row_id or len(row) != len(columns) or list(row) != columns:
+            raise ValueError(f"row {row_id} does not have the columns {columns} with its id first")
+
+    limit = min(MAX_ENUM_VALUES, len(rows) // 2)
+    enums = {}
+    column_values = []
+    for column in columns:
+        values = [row[column] for row in rows]
+        dictionary = enum_values(values, limit) if column != key else None
+        if dictionary:
+            codes = {value: code for code, value in enumerate(dictionary)}
+            codes[None] = None
+            values = [codes[value] for value in values]
+            enums[column] = dictionary
+        column_values.append(values)
+    return {'key': key, 'columns': columns, 'enums': enums, 'rows': [list(row) for row in zip(*column_values)]}
+
+def decode(payload):
+    """The {id: row} table a compact form stands for"""
+    columns = payload['columns']
+    if not payload['rows']:
+        return {}
+    column_values = list(zip(*payload['rows']))
+    for index, column in enumerate(columns):
+        dictionary = payload['enums'].get(column)
+        if dictionary is not None:
+            column_values[index] = [None if code is None else dictionary[code] for code in column_values[index]]
+    key_index = columns.index(payload['key'])
+    return {row[key_index]: dict(zip(columns, row)) for row in zip(*column_values)}
+
+def dump(table, f):
+    """Write a table's compact form to an open text file, one row per line"""
+    payload = encode(table)
+    f.write('{')
+    for name in ('key', 'columns', 'enums'):
+        f.write(f'"{name}": {json.dumps(payload[name], ensure_ascii=False)},\n')
+    f.write('"rows": [\n')
+    f.write(',\n'.join(json.dumps(row, ensure_ascii=False, separators=(',', ':')) for row in payload['rows']))
+    f.write('\n]}\n')
+
+def load(f):
+    """Read a table written by dump()"""
+    return decode(json.load(f))
+
+if __name__ == "__main__":
+    from dataset import TABLES, load_table
+
+    parser = argparse.ArgumentParser(description="Convert a generated dataset to compact JSON")
+    parser.add_argument('data_dir')
+    parser.add_argument('--output-dir', help="defaults to the data directory")
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or args.data_dir
+    os.makedirs(output_dir, exist_ok=True)
+    for table_name in TABLES:
+        table = load_table(table_name, args.data_dir)
+        path = table_path(table_name, output_dir)
+        with open(path, 'w', encoding='utf-8') as f:
+            dump(table, f)
+        print(f"{path}: {len(table)} rows, {os.path.getsize(path)} bytes")
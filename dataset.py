@@ -0,0 +1,92 @@
+"""Loading helpers for the generated incident management tables"""
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+
+import compact_json
+import sla_templates
+
+# Directory the generator writes to
+DATA_DIR = 'incident_management_data'
+
+# Tables in generation order, mapped to their primary key column
+PRIMARY_KEYS = {
+    'clients': 'client_id',
+    'vendors': 'vendor_id',
+    'users': 'user_id',
+    'products': 'product_id',
+    'infrastructure_components': 'component_id',
+    'client_subscriptions': 'subscription_id',
+    'sla_agreements': 'sla_id',
+    'incidents': 'incident_id',
+    'workarounds': 'workaround_id',
+    'root_cause_analysis': 'rca_id',
+    'communications': 'communication_id',
+    'incident_updates': 'update_id',
+    'escalations': 'escalation_id',
+    'change_requests': 'change_id',
+    'rollback_requests': 'rollback_id',
+    'metrics': 'metric_id',
+    'incident_reports': 'report_id',
+    'knowledge_base_articles': 'article_id',
+    'post_incident_reviews': 'pir_id',
+}
+
+TABLES = list(PRIMARY_KEYS)
+
+# Generated timestamps are naive; they are treated as UTC when converted to epoch seconds
+EPOCH = datetime(1970, 1, 1)
+
+def table_path(table_name, data_dir=DATA_DIR):
+    """Path of a table's JSON file"""
+    return os.path.join(data_dir, f"{table_name}.json")
+
+def load_table(table_name, data_dir=DATA_DIR):
+    """Load one table as the {id: row} dict the generator wrote"""
+    path = table_path(table_name, data_dir)
+    compact_path = compact_json.table_path(table_name, data_dir)
+    if not os.path.exists(path) and os.path.exists(compact_path):
+        # Written with seeded2.py --output-format compact
+        with open(compact_path, encoding='utf-8') as f:
+            return compact_json.load(f)
+    if table_name == 'sla_agreements' and not os.path.exists(path):
+        # Written in compact form (seeded2.py --compact-sla)
+        with open(table_path('sla_templates', data_dir), encoding='utf-8') as f:
+            return sla_templates.expand(json.load(f))
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def load_data(tables=None, data_dir=DATA_DIR):
+    """Load several tables (all by default) into a dict shaped like the generator's `data`"""
+    return {table_name: load_table(table_name, data_dir) for table_name in (tables or TABLES)}
+
+def end_of(value):
+    """An inclusive upper bound: a bare YYYY-MM-DD date means the end of that day"""
+    if isinstance(value, str) and len(value) == 10:
+        return f"{value}T23:59:59.999999"
+    return value
+
+def to_epoch(value):
+    """Convert a datetime, date, ISO string or number to epoch seconds (None -> NaN)"""
+    if value is None:
+        return float('nan')
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', ''))
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH).total_seconds()
+
+def epoch_column(rows, column):
+    """Return (ids, float64 epoch array) for a timestamp column; nulls become NaN"""
+    ids = list(rows)
+    # numpy parses the ISO strings in C, which is several times faster than fromisoformat per row
+    stamps = np.array([row[column] for row in rows.values()], dtype='datetime64[us]')
+    epochs = stamps.astype(np.int64) / 1e6
+    epochs[np.isnat(stamps)] = np.nan
+    return ids, epochs
@@ -0,0 +1,117 @@
+"""Row-level diff between two generated datasets.
+
+Each table is compared through its Merkle tree (see merkle): tables whose
+roots match are skipped without being loaded, and in the others only the
+chunks whose hashes differ are compared row by row. The result lists, per
+changed table, the rows inserted, the rows updated (their new version) and
+the ids deleted, which is all a downstream copy needs to catch up.
+
+Trees are read from <table>.merkle.json when present (seeded2.py --merkle
+writes them; `build` adds them to an existing dataset) and computed from
+the table otherwise.
+
+    python dataset_diff.py build DATA_DIR [--chunk-size N]
+    python dataset_diff.py diff OLD_DIR NEW_DIR [--output-dir DIR]
+
+`diff` prints a summary and, with --output-dir, writes <table>.diff.json for
+every changed table.
+"""
+import argparse
+import json
+import os
+import time
+
+import merkle
+from dataset import TABLES, load_table
+
+def load_rows(table_name, data_dir):
+    """A table's rows, or an empty table if the dataset does not have it"""
+    try:
+        return load_table(table_name, data_dir)
+    except FileNotFoundError:
+        return {}
+
+def table_tree(table_name, data_dir, chunk_size, rows=None):
+    """The stored tree if it uses chunk_size, else one built from the table; returns (tree, rows or None)"""
+    tree = merkle.load(table_name, data_dir)
+    if tree is not None and tree['chunk_size'] == chunk_size:
+        return tree, rows
+    if rows is None:
+        rows = load_rows(table_name, data_dir)
+    return merkle.build(rows, chunk_size), rows
+
+def diff_chunks(old_rows, new_rows, chunks, chunk_size):
+    """Inserted, updated and deleted rows within the given chunks"""
+    changes = {'inserted': {}, 'updated': {}, 'deleted': []}
+    for chunk in chunks:
+        for number in range(chunk * chunk_size, (chunk + 1) * chunk_size):
+            row_id = str(number)
+            old_row = old_rows.get(row_id)
+            new_row = new_rows.get(row_id)
+            if old_row is None and new_row is not None:
+                changes['inserted'][row_id] = new_row
+            elif new_row is None and old_row is not None:
+                changes['deleted'].append(row_id)
+            elif old_row != new_row:
+                changes['updated'][row_id] = new_row
+    return changes
+
+def diff_table(table_name, old_dir, new_dir, chunk_size=merkle.DEFAULT_CHUNK_SIZE):
+    """Changes to one table, or None if its rows are identical"""
+    old_tree, old_rows = table_tree(table_name, old_dir, chunk_size)
+    new_tree, new_rows = table_tree(table_name, new_dir, chunk_size)
+    if old_tree['root'] == new_tree['root']:
+        return None
+    chunks = merkle.changed_chunks(old_tree, new_tree)
+    if old_rows is None:
+        old_rows = load_rows(table_name, old_dir)
+    if new_rows is None:
+        new_rows = load_rows(table_name, new_dir)
+    changes = diff_chunks(old_rows, new_rows, chunks, chunk_size)
+    changes['chunks'] = len(chunks)
+    return changes
+
+def diff(old_dir, new_dir, tables=None, chunk_size=merkle.DEFAULT_CHUNK_SIZE):
+    """{table: changes} for every table that differs between two dataset directories"""
+    result = {}
+    for table_name in tables or TABLES:
+        changes = diff_table(table_name, old_dir, new_dir, chunk_size)
+        if changes is not None:
+            result[table_name] = changes
+    return result
+
+def build_trees(data_dir, tables=None, chunk_size=merkle.DEFAULT_CHUNK_SIZE):
+    """Write <table>.merkle.json for every table in a dataset directory"""
+    paths = []
+    for table_name in tables or TABLES:
+        paths.append(merkle.save(merkle.build(load_rows(table_name, data_dir), chunk_size), table_name, data_dir))
+    return paths
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merkle-tree diff between two generated datasets")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build_parser = commands.add_parser('build', help="store a Merkle tree beside every table")
+    build_parser.add_argument('data_dir')
+    build_parser.add_argument('--chunk-size', type=int, default=merkle.DEFAULT_CHUNK_SIZE)
+    diff_parser = commands.add_parser('diff', help="list inserted, updated and deleted rows")
+    diff_parser.add_argument('old_dir')
+    diff_parser.add_argument('new_dir')
+    diff_parser.add_argument('--output-dir', help="write <table>.diff.json for each changed table here")
+    diff_parser.add_argument('--chunk-size', type=int, default=merkle.DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'build':
+        paths = build_trees(args.data_dir, chunk_size=args.chunk_size)
+        print(f"Wrote {len(paths)} trees to {args.data_dir} ({time.perf_counter() - start:.2f}s)")
+    else:
+        changes = diff(args.old_dir, args.new_dir, chunk_size=args.chunk_size)
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+        for table_name, table_changes in changes.items():
+            print(f"{table_name}: {len(table_changes['inserted'])} inserted, {len(table_changes['updated'])} updated, "
+                  f"{len(table_changes['deleted'])} deleted ({table_changes['chunks']} chunks compared)")
+            if args.output_dir:
+                with open(os.path.join(args.output_dir, f"{table_name}.diff.json"), 'w', encoding='utf-8') as f:
+                    json.dump(table_changes, f, indent=2, ensure_ascii=False)
+        print(f"{len(changes)} of {len(TABLES)} tables changed ({time.perf_counter() - start:.2f}s)")
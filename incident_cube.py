@@ -0,0 +1,249 @@
+"""Precomputed aggregation cube over incidents.
+
+Reports group incident counts, downtime and MTTR by any combination of a
+time grain (day or week of detected_at) and six dimensions: severity,
+sla_tier, category, component_type, client_type and status. The cube holds
+every such group-by (a cuboid per combination: 64 per time grain plus 64
+without time), so any slice is read from precomputed cells.
+
+Cells keep additive measures only - incidents, downtime_minutes, resolved
+and resolution_hours (detected -> resolved) - and MTTR is derived when a
+cell is read, so cells can be summed. That makes the build a series of
+rollups: the finest cuboid (day x all dimensions) is aggregated from the
+incidents once, and every other cuboid from its smallest already built
+parent. It also makes incremental updates exact: update() adds the
+incidents appended since the cube was built (higher ids) to every cuboid,
+and add_incidents(..., sign=-1) takes a changed incident's old version out.
+
+Dimension values come from incident_view rows, which already carry the
+client, component and SLA attributes.
+
+    python incident_cube.py build [data_dir] [--cube incident_cube.json] [--incremental]
+    python incident_cube.py query [--cube incident_cube.json] [--group-by week,severity] [sla_tier=premium ...]
+"""
+import argparse
+import json
+import os
+import time
+from datetime import date, datetime, timedelta
+from itertools import combinations
+
+from incident_view import build_view
+
+TIME_GRAINS = ('day', 'week')
+DIMENSIONS = ('severity', 'sla_tier', 'category', 'component_type', 'client_type', 'status')
+MEASURES = ('incidents', 'downtime_minutes', 'resolved', 'resolution_hours')
+
+SET_TYPES = (list, tuple, set, frozenset)
+
+def week_of(day):
+    """Monday of the ISO week containing day (YYYY-MM-DD)"""
+    start = date.fromisoformat(day)
+    return (start - timedelta(days=start.weekday())).isoformat()
+
+def cell_measures(row):
+    resolution_hours = 0.0
+    if row['resolved_at'] is not None:
+        resolved = datetime.fromisoformat(row['resolved_at']) - datetime.fromisoformat(row['detected_at'])
+        resolution_hours = resolved.total_seconds() / 3600
+    return [1, row['downtime_minutes'] or 0, int(row['resolved_at'] is not None), resolution_hours]
+
+def accumulate(cells, key, measures, sign=1):
+    cell = cells.get(key)
+    if cell is None:
+        cells[key] = [sign * value for value in measures]
+    else:
+        for position, value in enumerate(measures):
+            cell[position] += sign * value
+
+def cuboid_names():
+    """(grain, dims) for every cuboid, finest first within each grain"""
+    names = []
+    for grain in TIME_GRAINS + (None,):
+        for size in range(len(DIMENSIONS), -1, -1):
+            names.extend((grain, dims) for dims in combinations(DIMENSIONS, size))
+    return names
+
+def key_columns(grain, dims):
+    return ((grain,) if grain else ()) + dims
+
+def roll_up(parent_cells, parent_columns, columns, key_map=None):
+    """Aggregate a parent cuboid's cells onto a subset of its columns (after key_map, if given, rewrites each key)"""
+    positions = [parent_columns.index(column) for column in columns]
+    cells = {}
+    for parent_key, measures in parent_cells.items():
+        if key_map is not None:
+            parent_key = key_map(parent_key)
+        accumulate(cells, tuple(parent_key[position] for position in positions), measures)
+    return cells
+
+def build_cube(view_rows):
+    """Every cuboid over the given incident_view rows"""
+    base = {}
+    for row in view_rows.values():
+        key = (row['detected_at'][:10],) + tuple(row[dim] for dim in DIMENSIONS)
+        accumulate(base, key, cell_measures(row))
+
+    cuboids = {('day', DIMENSIONS): base}
+    weeks = {}
+    def to_week(key):
+        if key[0] not in weeks:
+            weeks[key[0]] = week_of(key[0])
+        return (weeks[key[0]],) + key[1:]
+    cuboids[('week', DIMENSIONS)] = roll_up(base, ('week',) + DIMENSIONS, ('week',) + DIMENSIONS, to_week)
+    cuboids[(None, DIMENSIONS)] = roll_up(cuboids[('week', DIMENSIONS)], ('week',) + DIMENSIONS, DIMENSIONS)
+
+    for grain, dims in cuboid_names():
+        if (grain, dims) in cuboids:
+            continue
+        # Smallest built parent: the same grain with one more dimension
+        parents = [(grain, tuple(d for d in DIMENSIONS if d in dims or d == extra))
+                   for extra in DIMENSIONS if extra not in dims]
+        parent = min(parents, key=lambda name: len(cuboids[name]))
+        cuboids[(grain, dims)] = roll_up(cuboids[parent], key_columns(*parent), key_columns(grain, dims))
+
+    last_id = max((int(incident_id) for incident_id in view_rows), default=0)
+    return {'incidents_through': last_id, 'cuboids': cuboids}
+
+def add_incidents(cube, view_rows, sign=1):
+    """Add incident_view rows to every cuboid (sign=-1 removes rows added before)"""
+    for row in view_rows.values():
+        day = row['detected_at'][:10]
+        times = {'day': day, 'week': week_of(day), None: None}
+        values = {dim: row[dim] for dim in DIMENSIONS}
+        measures = cell_measures(row)
+        for (grain, dims), cells in cube['cuboids'].items():
+            key = ((times[grain],) if grain else ()) + tuple(values[dim] for dim in dims)
+            accumulate(cells, key, measures, sign)
+            if cells[key][0] == 0:
+                del cells[key]
+    if sign > 0 and view_rows:
+        cube['incidents_through'] = max(cube['incidents_through'], *(int(incident_id) for incident_id in view_rows))
+
+def update(cube, data):
+    """Add the incidents appended to data since the cube was last built or updated"""
+    new_incidents = {incident_id: incident for incident_id, incident in data['incidents'].items()
+                     if int(incident_id) > cube['incidents_through']}
+    add_incidents(cube, build_view(dict(data, incidents=new_incidents)))
+    return len(new_incidents)
+
+def read_cell(measures):
+    incidents, downtime, resolved, resolution_hours = measures
+    return {
+        'incidents': incidents,
+        'downtime_minutes': downtime,
+        'resolved': resolved,
+        'mttr_hours': round(resolution_hours / resolved, 2) if resolved else None,
+    }
+
+def query(cube, group_by=(), **filters):
+    """{group key: measures} for incidents matching the filters, grouped by group_by.
+
+    Filters take a value or a set of values; day or week may be grouped or
+    filtered on (not both). Only the one cuboid covering the named columns
+    is read; when every column is an equality filter that is one lookup.
+    """
+    columns = set(group_by) | set(filters)
+    grains = [grain for grain in TIME_GRAINS if grain in columns]
+    unknown = columns - set(TIME_GRAINS) - set(DIMENSIONS)
+    if unknown or len(grains) > 1:
+        raise KeyError(f"cannot group or filter on {sorted(unknown) or grains}")
+    grain = grains[0] if grains else None
+    dims = tuple(dim for dim in DIMENSIONS if dim in columns)
+    cells = cube['cuboids'][(grain, dims)]
+    cuboid_columns = key_columns(grain, dims)
+
+    if not group_by and all(not isinstance(value, SET_TYPES) for value in filters.values()):
+        measures = cells.get(tuple(filters[column] for column in cuboid_columns))
+        return {(): read_cell(measures or [0] * len(MEASURES))}
+
+    wanted = [(position, set(filters[column]) if isinstance(filters[column], SET_TYPES) else {filters[column]})
+              for position, column in enumerate(cuboid_columns) if column in filters]
+    group_positions = [cuboid_columns.index(column) for column in group_by]
+    totals = {}
+    for key, measures in cells.items():
+        if all(key[position] in values for position, values in wanted):
+            accumulate(totals, tuple(key[position] for position in group_positions), measures)
+    return {key: read_cell(measures) for key, measures in sorted(totals.items(), key=lambda item: str(item[0]))}
+
+def save(cube, path):
+    """Write the cube with one value dictionary per column and cells as rows of codes and measures"""
+    dictionaries = {column: {} for column in TIME_GRAINS + DIMENSIONS}
+    cuboids = {}
+    for (grain, dims), cells in cube['cuboids'].items():
+        columns = key_columns(grain, dims)
+        rows = []
+        for key, measures in cells.items():
+            codes = [dictionaries[column].setdefault(value, len(dictionaries[column]))
+                     for column, value in zip(columns, key)]
+            rows.append(codes + [round(value, 4) if isinstance(value, float) else value for value in measures])
+        cuboids[','.join(columns)] = rows
+    payload = {
+        'incidents_through': cube['incidents_through'],
+        'measures': MEASURES,
+        'dictionaries': {column: list(values) for column, values in dictionaries.items()},
+        'cuboids': cuboids,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, separators=(',', ':'))
+
+def load(path):
+    with open(path, encoding='utf-8') as f:
+        payload = json.load(f)
+    dictionaries = payload['dictionaries']
+    cuboids = {}
+    for name, rows in payload['cuboids'].items():
+        columns = tuple(name.split(',')) if name else ()
+        grain = columns[0] if columns and columns[0] in TIME_GRAINS else None
+        dims = columns[1:] if grain else columns
+        width = len(columns)
+        cuboids[(grain, dims)] = {
+            tuple(dictionaries[column][code] for column, code in zip(columns, row[:width])): row[width:]
+            for row in rows
+        }
+    return {'incidents_through': payload['incidents_through'], 'cuboids': cuboids}
+
+if __name__ == "__main__":
+    from dataset import DATA_DIR, load_data
+    from incident_view import READS
+
+    parser = argparse.ArgumentParser(description="Build or query the incident aggregation cube")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build_parser = commands.add_parser('build', help="aggregate a dataset's incidents into the cube")
+    build_parser.add_argument('data_dir', nargs='?', default=DATA_DIR)
+    build_parser.add_argument('--cube', default='incident_cube.json')
+    build_parser.add_argument('--incremental', action='store_true',
+                              help="add only incidents newer than those already in an existing cube")
+    query_parser = commands.add_parser('query', help="read a slice from the cube")
+    query_parser.add_argument('filters', nargs='*', metavar='COLUMN=VALUE[,VALUE...]')
+    query_parser.add_argument('--cube', default='incident_cube.json')
+    query_parser.add_argument('--group-by', type=lambda value: value.split(','), default=[],
+                              metavar='COLUMN[,COLUMN...]')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        data = load_data(READS, data_dir=args.data_dir)
+        start = time.perf_counter()
+        if args.incremental and os.path.exists(args.cube):
+            cube = load(args.cube)
+            added = update(cube, data)
+        else:
+            cube = build_cube(build_view(data))
+            added = len(data['incidents'])
+        save(cube, args.cube)
+        cells = sum(len(cells) for cells in cube['cuboids'].values())
+        print(f"{args.cube}: {added} incidents added, {len(cube['cuboids'])} cuboids, {cells} cells "
+              f"({time.perf_counter() - start:.2f}s)")
+    else:
+        cube = load(args.cube)
+        filters = {}
+        for arg in args.filters:
+            column, _, raw = arg.partition('=')
+            values = raw.split(',')
+            filters[column] = values[0] if len(values) == 1 else values
+        start = time.perf_counter()
+        result = query(cube, args.group_by, **filters)
+        elapsed = time.perf_counter() - start
+        for key, measures in result.items():
+            print('\t'.join(str(value) for value in key + tuple(measures.values())))
+        print(f"{len(result)} groups ({elapsed * 1e6:.0f} us)")
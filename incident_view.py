@@ -0,0 +1,94 @@
+"""Denormalised incident view for dashboards.
+
+One wide row per incident carrying what dashboards otherwise join for on
+every request: the client's name and type, the component's type and
+location, its product and vendor, and the SLA tier and targets that apply
+to the incident's severity, next to the incident's own status, timings and
+breach flags.
+
+The view is a chain of hash joins: each dimension table is hashed once
+(for the SLA, the subscription is found as in generate_incidents:
+component -> product -> the last subscription listed for that product),
+then a single pass over the incidents probes them. Incidents whose
+component has no subscription get nulls in the SLA columns.
+
+seeded2.py --views adds it as an export stage (incident_view.json, in the
+chosen output format). For an existing dataset:
+
+    python incident_view.py [data_dir] [--output-dir DIR]
+"""
+import argparse
+import os
+import time
+
+READS = ['incidents', 'clients', 'infrastructure_components', 'products', 'vendors',
+         'client_subscriptions', 'sla_agreements']
+
+INCIDENT_COLUMNS = ('incident_id', 'title', 'severity', 'status', 'impact', 'urgency', 'category',
+                    'detected_at', 'resolved_at', 'closed_at', 'downtime_minutes',
+                    'sla_breach', 'rto_breach', 'is_recurring', 'client_id', 'component_id')
+
+def build_view(data):
+    """{incident_id: wide row} joining every incident to its dimensions"""
+    clients = data['clients']
+    components = data['infrastructure_components']
+    products = data['products']
+    vendors = data['vendors']
+
+    # Build sides: dimension rows keyed by the column incidents reach them through
+    subscription_by_product = {}
+    for subscription in data['client_subscriptions'].values():
+        subscription_by_product[subscription['product_id']] = subscription
+    sla_by_key = {(sla['subscription_id'], sla['severity_level']): sla for sla in data['sla_agreements'].values()}
+
+    view = {}
+    for incident_id, incident in data['incidents'].items():
+        row = {column: incident[column] for column in INCIDENT_COLUMNS}
+        client = clients.get(incident['client_id'])
+        component = components.get(incident['component_id'])
+        product = products.get(component['product_id']) if component else None
+        vendor = vendors.get(product['vendor_support_id']) if product else None
+        subscription = subscription_by_product.get(component['product_id']) if component else None
+        sla = sla_by_key.get((subscription['subscription_id'], incident['severity'])) if subscription else None
+        row.update({
+            'client_name': client and client['client_name'],
+            'client_type': client and client['client_type'],
+            'component_name': component and component['component_name'],
+            'component_type': component and component['component_type'],
+            'environment': component and component['environment'],
+            'location': component and component['location'],
+            'product_id': product and product['product_id'],
+            'product_name': product and product['product_name'],
+            'product_type': product and product['product_type'],
+            'vendor_id': vendor and vendor['vendor_id'],
+            'vendor_name': vendor and vendor['vendor_name'],
+            'vendor_type': vendor and vendor['vendor_type'],
+            'subscription_id': subscription and subscription['subscription_id'],
+            'sla_tier': subscription and subscription['sla_tier'],
+            'rto_hours': subscription and subscription['rto_hours'],
+            'sla_id': sla and sla['sla_id'],
+            'response_time_minutes': sla and sla['response_time_minutes'],
+            'resolution_time_hours': sla and sla['resolution_time_hours'],
+            'availability_percentage': sla and sla['availability_percentage'],
+        })
+        view[incident_id] = row
+    return view
+
+if __name__ == "__main__":
+    from dataset import DATA_DIR, load_data
+    from seeded2 import write_table
+
+    parser = argparse.ArgumentParser(description="Write the denormalised incident view of a generated dataset")
+    parser.add_argument('data_dir', nargs='?', default=DATA_DIR)
+    parser.add_argument('--output-dir', help="defaults to the data directory")
+    parser.add_argument('--output-format', choices=['json', 'compact'], default='json')
+    args = parser.parse_args()
+
+    data = load_data(READS, data_dir=args.data_dir)
+    start = time.perf_counter()
+    view = build_view(data)
+    elapsed = time.perf_counter() - start
+    output_dir = args.output_dir or args.data_dir
+    os.makedirs(output_dir, exist_ok=True)
+    filename = write_table('incident_view', view, output_dir, output_format=args.output_format)
+    print(f"{filename}: {len(view)} incidents ({elapsed:.3f}s)")
@@ -0,0 +1,132 @@
+"""Stage-level timing and memory instrumentation for dataset generation"""
+import cProfile
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+def deep_sizeof(obj):
+    """Approximate bytes held by obj and everything it references (shared objects counted once)"""
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+def host_info():
+    """Identify the machine and interpreter a report was produced on"""
+    return {
+        'host': platform.node(),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def start_report(**parameters):
+    """New machine-readable report; starts tracemalloc if it is not already tracing"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return {
+        'created_at': datetime.now().isoformat(),
+        **host_info(),
+        'parameters': parameters,
+        'stages': {},
+        'writes': {},
+        # Bytes of every table held in data during the run, generated, cached or resumed
+        'table_bytes': {},
+        # Bytes of the tables still in data as each stage finished, in finishing order
+        'retained_bytes': {},
+    }
+
+def run_stage(report, table_name, generate, data, cprofile_dir=None):
+    """Run one generator stage and record wall/CPU time, throughput and memory in the report"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    profiler = cProfile.Profile() if cprofile_dir else None
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    if profiler:
+        profiler.enable()
+    generate()
+    if profiler:
+        profiler.disable()
+    cpu_seconds = time.process_time() - cpu_start
+    wall_seconds = time.perf_counter() - wall_start
+
+    _, peak = tracemalloc.get_traced_memory()
+    rows = len(data.get(table_name, ()))
+    table_bytes = deep_sizeof(data[table_name]) if table_name in data else 0
+
+    stage = {
+        'wall_seconds': round(wall_seconds, 4),
+        'cpu_seconds': round(cpu_seconds, 4),
+        'rows': rows,
+        'rows_per_second': round(rows / wall_seconds, 1) if wall_seconds > 0 else None,
+        'tracemalloc_peak_bytes': peak,
+        'table_bytes': table_bytes,
+    }
+    if profiler:
+        os.makedirs(cprofile_dir, exist_ok=True)
+        stage['cprofile'] = os.path.join(cprofile_dir, f"{table_name}.prof")
+        profiler.dump_stats(stage['cprofile'])
+
+    report['stages'][table_name] = stage
+    return stage
+
+def record_retained(report, table_name, data):
+    """Record the bytes of the tables still in data once table_name's stage is done
+
+    Tables released or spilled by then are no longer in data, so this is what
+    release_memory and a memory budget save. Tables are not modified after
+    their stage, so each one is measured once.
+    """
+    sizes = report['table_bytes']
+    for name, table in data.items():
+        if name not in sizes:
+            stage = report['stages'].get(name)
+            sizes[name] = stage['table_bytes'] if stage else deep_sizeof(table)
+    report['retained_bytes'][table_name] = sum(sizes[name] for name in data)
+    return report['retained_bytes'][table_name]
+
+def record_write(report, table_name, filename, encode_seconds):
+    """Record how long a table took to encode and write, and the resulting file size"""
+    report['writes'][table_name] = {
+        'file': filename,
+        'encode_seconds': round(encode_seconds, 4),
+        'file_bytes': os.path.getsize(filename),
+    }
+
+def finish_report(report, generate_seconds=None):
+    """Add run totals to the report
+
+    wall_seconds sums the stages; generate_seconds, when given, is the elapsed
+    time of the whole generation phase, which is shorter when stages overlap.
+    """
+    stages = report['stages'].values()
+    writes = report['writes'].values()
+    report['totals'] = {
+        'wall_seconds': round(sum(s['wall_seconds'] for s in stages), 4),
+        'cpu_seconds': round(sum(s['cpu_seconds'] for s in stages), 4),
+        'encode_seconds': round(sum(w['encode_seconds'] for w in writes), 4),
+        'rows': sum(s['rows'] for s in stages),
+        'file_bytes': sum(w['file_bytes'] for w in writes),
+        'tracemalloc_peak_bytes': max((s['tracemalloc_peak_bytes'] for s in stages), default=0),
+        'retained_bytes': max(report['retained_bytes'].values(), default=0),
+    }
+    if generate_seconds is not None:
+        report['totals']['generate_seconds'] = round(generate_seconds, 4)
+    return report
@@ -0,0 +1,95 @@
+"""Table liveness and memory budgeting for generation runs.
+
+A table is live while some stage that has not finished yet still reads it
+(STAGE_READS). Once its last reader finishes, a table that has already been
+written to the output directory can be dropped from `data`.
+
+With a memory budget, live tables that no running or imminent stage needs
+are additionally spilled to a temporary pickle when the estimated resident
+size goes over budget, and loaded back just before a stage that reads them
+runs. The table whose next reader is furthest away is spilled first.
+"""
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+
+from instrumentation import deep_sizeof
+
+def remaining_readers(stages, reads):
+    """{table: number of the given stages that read it}"""
+    readers = {table_name: 0 for table_name, _, _ in stages}
+    for table_name, _, _ in stages:
+        for upstream in reads[table_name]:
+            readers[upstream] = readers.get(upstream, 0) + 1
+    return readers
+
+def finish_reads(readers, upstream_tables):
+    """Record that a stage reading upstream_tables has finished; returns the tables that became dead"""
+    dead = []
+    for upstream in upstream_tables:
+        readers[upstream] -= 1
+        if readers[upstream] == 0:
+            dead.append(upstream)
+    return dead
+
+def estimate_bytes(table, sample=200):
+    """Approximate deep size of a {id: row} table from a sample of its rows"""
+    if not table:
+        return sys.getsizeof(table)
+    rows = []
+    for row in table.values():
+        rows.append(row)
+        if len(rows) == sample:
+            break
+    return sys.getsizeof(table) + deep_sizeof(rows) * len(table) // len(rows)
+
+def start_spill(budget_bytes):
+    """Spill state for a run with the given budget (a temporary directory holds spilled tables)"""
+    return {'budget': budget_bytes, 'dir': tempfile.mkdtemp(prefix='incident-spill-'), 'sizes': {}, 'spilled': set()}
+
+def finish_spill(spill):
+    shutil.rmtree(spill['dir'], ignore_errors=True)
+
+def spill_path(spill, table_name):
+    return os.path.join(spill['dir'], f"{table_name}.pkl")
+
+def track(spill, data, table_name):
+    """Start accounting a table that has just been added to data"""
+    spill['sizes'][table_name] = estimate_bytes(data[table_name])
+
+def forget(spill, table_name):
+    """Stop accounting a table that has been dropped for good"""
+    spill['sizes'].pop(table_name, None)
+    if table_name in spill['spilled']:
+        spill['spilled'].discard(table_name)
+        os.remove(spill_path(spill, table_name))
+
+def ensure_loaded(spill, data, table_names):
+    """Load any of table_names that were spilled back into data"""
+    for table_name in table_names:
+        if table_name in spill['spilled']:
+            with open(spill_path(spill, table_name), 'rb') as f:
+                data[table_name] = pickle.load(f)
+            spill['spilled'].discard(table_name)
+            os.remove(spill_path(spill, table_name))
+
+def enforce_budget(spill, data, next_use, protected=()):
+    """Spill resident tables, furthest next use first, until the estimate fits the budget
+
+    next_use maps each live table to the position of the next stage that
+    reads it; tables in protected (read by running or imminent stages) stay.
+    """
+    resident = [name for name in spill['sizes'] if name in data and name not in spill['spilled']]
+    total = sum(spill['sizes'][name] for name in resident)
+    candidates = sorted((name for name in resident if name not in protected and name in next_use),
+                        key=lambda name: -next_use[name])
+    for table_name in candidates:
+        if total <= spill['budget']:
+            break
+        with open(spill_path(spill, table_name), 'wb') as f:
+            pickle.dump(data.pop(table_name), f, protocol=pickle.HIGHEST_PROTOCOL)
+        spill['spilled'].add(table_name)
+        total -= spill['sizes'][table_name]
+    return total
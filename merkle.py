@@ -0,0 +1,102 @@
+"""Merkle trees over ID-range chunks of a table.
+
+Rows are grouped into chunks by numeric id (chunk = id // chunk_size), and
+each chunk is hashed over its rows' ids and canonical JSON. Chunks are the
+leaves of a binary tree: the node at level L, index i covers chunks
+[i * 2**L, (i + 1) * 2**L). Empty ranges have no node, and a node with one
+child takes that child's hash, so a tree's root does not depend on its
+height and two trees of different heights compare node for node.
+
+Two trees with equal roots hold identical rows; otherwise changed_chunks()
+descends only into subtrees whose hashes differ, which finds the changed
+chunks in time proportional to their number (times the tree height).
+
+Trees are stored beside the table as <table>.merkle.json:
+
+    {"chunk_size": 256, "rows": 1676, "root": "...",
+     "levels": [{"0": "...", "1": "..."}, ..., {"0": "<root>"}]}
+"""
+import hashlib
+import json
+import os
+
+DEFAULT_CHUNK_SIZE = 256
+SUFFIX = '.merkle.json'
+
+def tree_path(table_name, data_dir):
+    return os.path.join(data_dir, f"{table_name}{SUFFIX}")
+
+def row_bytes(row_id, row):
+    return f"{row_id}\0{json.dumps(row, sort_keys=True, ensure_ascii=False, separators=(',', ':'))}\n".encode('utf-8')
+
+def chunk_ids(table, chunk_size):
+    """{chunk: [row ids in id order]}; ids must be integers (as strings or ints)"""
+    chunks = {}
+    for row_id in sorted(table, key=int):
+        chunks.setdefault(int(row_id) // chunk_size, []).append(row_id)
+    return chunks
+
+def chunk_hash(table, row_ids):
+    digest = hashlib.sha256()
+    for row_id in row_ids:
+        digest.update(row_bytes(row_id, table[row_id]))
+    return digest.hexdigest()
+
+def parent_hash(left, right):
+    if left is None or right is None:
+        return left if right is None else right
+    return hashlib.sha256(f"{left}{right}".encode('ascii')).hexdigest()
+
+def build(table, chunk_size=DEFAULT_CHUNK_SIZE):
+    """The Merkle tree of a {id: row} table"""
+    leaves = {chunk: chunk_hash(table, row_ids) for chunk, row_ids in chunk_ids(table, chunk_size).items()}
+    levels = [leaves]
+    while len(levels[-1]) > 1 or any(index != 0 for index in levels[-1]):
+        children = levels[-1]
+        parents = {}
+        for index in sorted({index // 2 for index in children}):
+            parents[index] = parent_hash(children.get(2 * index), children.get(2 * index + 1))
+        levels.append(parents)
+    return {
+        'chunk_size': chunk_size,
+        'rows': len(table),
+        'root': levels[-1].get(0),
+        'levels': [{str(index): node for index, node in level.items()} for level in levels],
+    }
+
+def save(tree, table_name, data_dir):
+    path = tree_path(table_name, data_dir)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(tree, f)
+    return path
+
+def load(table_name, data_dir):
+    """A table's stored tree, or None if it has none"""
+    path = tree_path(table_name, data_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def node(tree, level, index):
+    """Hash of a node (None for an empty range); levels above the tree's top repeat its root"""
+    levels = tree['levels']
+    if level >= len(levels):
+        return tree['root'] if index == 0 else None
+    return levels[level].get(str(index))
+
+def changed_chunks(old_tree, new_tree):
+    """Sorted chunk numbers whose rows differ between two trees with the same chunk size"""
+    if old_tree['chunk_size'] != new_tree['chunk_size']:
+        raise ValueError(f"chunk sizes differ: {old_tree['chunk_size']} and {new_tree['chunk_size']}")
+    changed = []
+    stack = [(max(len(old_tree['levels']), len(new_tree['levels'])) - 1, 0)]
+    while stack:
+        level, index = stack.pop()
+        if node(old_tree, level, index) == node(new_tree, level, index):
+            continue
+        if level == 0:
+            changed.append(index)
+        else:
+            stack += [(level - 1, 2 * index + 1), (level - 1, 2 * index)]
+    return sorted(changed)
@@ -0,0 +1,242 @@
+"""Live progress, throughput and ETA for generation runs, with Prometheus export.
+
+Generators wrap their main loop in track(), which is a no-op unless a run
+has been started with start_run(). While a run is active the current stage's
+counters are rendered on the terminal (stderr) and, at most every
+`interval` seconds, exported in the Prometheus text format to a file
+(for node_exporter's textfile collector) and/or served over HTTP at
+/metrics.
+
+Only the main process reports. Stages that run in pool workers (seeded2.py
+--workers > 1) are started and finished by name from the main process, so
+for those the stage and run counters advance and rows are counted when the
+stage finishes, but there is no per-row progress, throughput or ETA while
+it runs.
+"""
+import os
+import sys
+import threading
+import time
+
+METRIC_PREFIX = 'incident_generator'
+
+# Module-level run state, like the generator's global `data`
+state = {
+    'active': False,
+    'stages_total': 0,
+    'stages_done': 0,
+    'stage': None,
+    'unit': 'rows',
+    'done': 0,
+    'total': None,
+    'stage_started': 0.0,
+    'run_started': 0.0,
+    'last_emit': 0.0,
+    'completed': {},
+    'started': {},
+    'terminal': False,
+    'metrics_file': None,
+    'interval': 1.0,
+    'server': None,
+}
+lock = threading.Lock()
+
+def start_run(stages_total, terminal=None, metrics_file=None, metrics_port=None, interval=1.0, stages_done=0):
+    """Begin reporting a run of stages_total stages (stages_done of them already finished, e.g. on resume)"""
+    state.update(
+        active=True, stages_total=stages_total, stages_done=stages_done, stage=None, done=0, total=None,
+        run_started=time.monotonic(), last_emit=0.0, completed={}, started={},
+        terminal=sys.stderr.isatty() if terminal is None else terminal,
+        metrics_file=metrics_file, interval=interval,
+    )
+    if metrics_port is not None and state['server'] is None:
+        state['server'] = serve_metrics(metrics_port)
+    emit(force=True)
+
+def finish_run():
+    """Flush final metrics and stop reporting"""
+    emit(force=True)
+    state['active'] = False
+    if state['server'] is not None:
+        state['server'].shutdown()
+        state['server'] = None
+
+def start_stage(name):
+    """Begin counting a new stage"""
+    if not state['active']:
+        return
+    with lock:
+        state.update(stage=name, unit='rows', done=0, total=None, stage_started=time.monotonic())
+        state['started'][name] = state['stage_started']
+    emit(force=True)
+
+def finish_stage(rows, name=None):
+    """Close a stage (the current one by default), recording how many rows it produced
+
+    Stages running in worker processes are started and finished by name; their
+    rows are only counted when they finish, and they show no ETA before that.
+    """
+    if not state['active']:
+        return
+    with lock:
+        name = name or state['stage']
+        elapsed = time.monotonic() - state['started'].pop(name, state['stage_started'])
+        state['completed'][name] = {'rows': rows, 'seconds': elapsed}
+        state['stages_done'] += 1
+        state['done'] = state['total'] if state['total'] is not None else state['done']
+    emit(force=True)
+    if state['terminal']:
+        sys.stderr.write('\n')
+        sys.stderr.flush()
+    with lock:
+        if state['stage'] == name:
+            state['stage'] = None
+
+def track(iterable, unit='rows'):
+    """Iterate while counting progress for the current stage"""
+    if not state['active']:
+        return iterable
+    try:
+        total = len(iterable)
+    except TypeError:
+        total = None
+    with lock:
+        state.update(unit=unit, done=0, total=total)
+    return _track(iterable)
+
+def _track(iterable):
+    for item in iterable:
+        yield item
+        state['done'] += 1
+        if time.monotonic() - state['last_emit'] >= state['interval']:
+            emit()
+
+def snapshot():
+    """Current counters, with throughput and ETA derived from them"""
+    with lock:
+        now = time.monotonic()
+        elapsed = now - state['stage_started'] if state['stage'] else 0.0
+        done, total = state['done'], state['total']
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / rate if total is not None and rate > 0 else None
+        return {
+            'stage': state['stage'],
+            'unit': state['unit'],
+            'done': done,
+            'total': total,
+            'rate': rate,
+            'eta': eta,
+            'stage_elapsed': elapsed,
+            'run_elapsed': now - state['run_started'],
+            'stages_done': state['stages_done'],
+            'stages_total': state['stages_total'],
+            'completed': dict(state['completed']),
+        }
+
+def format_duration(seconds):
+    """H:MM:SS, or '?' when unknown"""
+    if seconds is None:
+        return '?'
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+def render(counters):
+    """One-line terminal status"""
+    position = f"[{min(counters['stages_done'] + 1, counters['stages_total'])}/{counters['stages_total']}]"
+    total = f"/{counters['total']:,}" if counters['total'] is not None else ''
+    return (f"{position} {counters['stage'] or '-'}: {counters['done']:,}{total} {counters['unit']}"
+            f"  {counters['rate']:,.0f}/s  ETA {format_duration(counters['eta'])}"
+            f"  elapsed {format_duration(counters['run_elapsed'])}")
+
+def prometheus_text(counters):
+    """Counters in the Prometheus text exposition format"""
+    p = METRIC_PREFIX
+    stage = counters['stage'] or ''
+    lines = [
+        f"# HELP {p}_stages_total Number of generation stages in the run",
+        f"# TYPE {p}_stages_total gauge",
+        f"{p}_stages_total {counters['stages_total']}",
+        f"# HELP {p}_stages_completed Stages finished so far",
+        f"# TYPE {p}_stages_completed gauge",
+        f"{p}_stages_completed {counters['stages_done']}",
+        f"# HELP {p}_run_elapsed_seconds Seconds since the run started",
+        f"# TYPE {p}_run_elapsed_seconds gauge",
+        f"{p}_run_elapsed_seconds {counters['run_elapsed']:.3f}",
+        f"# HELP {p}_stage_done Work items finished in the current stage",
+        f"# TYPE {p}_stage_done gauge",
+        f'{p}_stage_done{{stage="{stage}",unit="{counters["unit"]}"}} {counters["done"]}',
+        f"# HELP {p}_stage_items_per_second Current stage throughput",
+        f"# TYPE {p}_stage_items_per_second gauge",
+        f'{p}_stage_items_per_second{{stage="{stage}"}} {counters["rate"]:.3f}',
+    ]
+    if counters['total'] is not None:
+        lines += [
+            f"# HELP {p}_stage_total Work items in the current stage",
+            f"# TYPE {p}_stage_total gauge",
+            f'{p}_stage_total{{stage="{stage}",unit="{counters["unit"]}"}} {counters["total"]}',
+        ]
+    if counters['eta'] is not None:
+        lines += [
+            f"# HELP {p}_stage_eta_seconds Estimated seconds left in the current stage",
+            f"# TYPE {p}_stage_eta_seconds gauge",
+            f'{p}_stage_eta_seconds{{stage="{stage}"}} {counters["eta"]:.3f}',
+        ]
+    if counters['completed']:
+        lines += [
+            f"# HELP {p}_table_rows Rows produced by each finished stage",
+            f"# TYPE {p}_table_rows gauge",
+        ]
+        lines += [f'{p}_table_rows{{table="{name}"}} {c["rows"]}' for name, c in counters['completed'].items()]
+        lines += [
+            f"# HELP {p}_stage_duration_seconds Wall time of each finished stage",
+            f"# TYPE {p}_stage_duration_seconds gauge",
+        ]
+        lines += [f'{p}_stage_duration_seconds{{stage="{name}"}} {c["seconds"]:.3f}'
+                  for name, c in counters['completed'].items()]
+    return '\n'.join(lines) + '\n'
+
+def write_metrics_file(path, text):
+    """Atomically replace the metrics file so scrapers never see a partial write"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def emit(force=False):
+    """Refresh the terminal line and the metrics file (throttled unless forced)"""
+    if not state['active']:
+        return
+    now = time.monotonic()
+    if not force and now - state['last_emit'] < state['interval']:
+        return
+    state['last_emit'] = now
+    counters = snapshot()
+    if state['terminal'] and counters['stage']:
+        sys.stderr.write('\r\033[K' + render(counters))
+        sys.stderr.flush()
+    if state['metrics_file']:
+        write_metrics_file(state['metrics_file'], prometheus_text(counters))
+
+def serve_metrics(port, host='127.0.0.1'):
+    """Serve the current counters at http://<host>:<port>/metrics (loopback only by default) from a daemon thread"""
+    import http.server
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip('/') != '/metrics':
+                self.send_error(404)
+                return
+            body = prometheus_text(snapshot()).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
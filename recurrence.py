@@ -0,0 +1,88 @@
+"""Recurrence index: which earlier incident each incident repeats.
+
+An incident recurs when its component already had an incident with the
+same title. generate_incidents flags the deliberate repeats it draws from a
+component's earlier titles as is_recurring, but never records which
+incident is repeated, and a title picked afresh can repeat one as well.
+The index links every incident to the first and the previous occurrence of
+its (component_id, title) key.
+
+Keys are hashed into chains of incident ids in detection order, in one pass
+over the incidents in id order: the generator assigns ids in detection order
+within a component, so chains come out sorted and the build is O(n). A
+chain that does not (hand-edited or merged data) is sorted on its own.
+
+    index = build_index(load_table('incidents'))
+    index['first']['812'], index['previous']['812']    # ids, None for a first occurrence
+    recurrence_chain(index, '812')                     # every occurrence of its key, oldest first
+    recurrence_rates(index)['17']                      # per component
+
+    python recurrence.py [data_dir] [--incident ID] [--top N]
+"""
+import argparse
+import time
+
+def build_index(incidents):
+    """Chains, first/previous links and per-component counts for a {id: incident} table"""
+    chains = {}
+    key_of = {}
+    for incident_id, incident in incidents.items():
+        key = (incident['component_id'], incident['title'])
+        key_of[incident_id] = key
+        chain = chains.setdefault(key, [])
+        chain.append(incident_id)
+        if len(chain) > 1 and incidents[chain[-2]]['detected_at'] > incident['detected_at']:
+            chain.sort(key=lambda chain_id: (incidents[chain_id]['detected_at'], int(chain_id)))
+
+    first = {}
+    previous = {}
+    components = {}
+    for (component_id, _), chain in chains.items():
+        counts = components.setdefault(component_id, {'incidents': 0, 'titles': 0, 'recurrences': 0, 'flagged': 0})
+        counts['incidents'] += len(chain)
+        counts['titles'] += 1
+        counts['recurrences'] += len(chain) - 1
+        prior = None
+        for incident_id in chain:
+            first[incident_id] = chain[0]
+            previous[incident_id] = prior
+            prior = incident_id
+            counts['flagged'] += bool(incidents[incident_id]['is_recurring'])
+    return {'chains': chains, 'key_of': key_of, 'first': first, 'previous': previous, 'components': components}
+
+def recurrence_chain(index, incident_id):
+    """Every incident sharing incident_id's component and title, oldest first"""
+    return index['chains'][index['key_of'][incident_id]]
+
+def recurrence_rates(index):
+    """{component_id: counts and recurrence rate (share of its incidents that repeat an earlier one)}"""
+    return {
+        component_id: dict(counts, rate=round(counts['recurrences'] / counts['incidents'], 4))
+        for component_id, counts in index['components'].items()
+    }
+
+if __name__ == "__main__":
+    from dataset import DATA_DIR, load_table
+
+    parser = argparse.ArgumentParser(description="Link recurring incidents to their earlier occurrences")
+    parser.add_argument('data_dir', nargs='?', default=DATA_DIR)
+    parser.add_argument('--incident', help="print the recurrence chain of this incident")
+    parser.add_argument('--top', type=int, default=10, help="print the components with the highest recurrence rate")
+    args = parser.parse_args()
+
+    incidents = load_table('incidents', args.data_dir)
+    start = time.perf_counter()
+    index = build_index(incidents)
+    elapsed = time.perf_counter() - start
+    if args.incident:
+        for incident_id in recurrence_chain(index, args.incident):
+            incident = incidents[incident_id]
+            print(f"{incident_id}\t{incident['detected_at']}\t{incident['is_recurring']}\t{incident['title']}")
+    else:
+        rates = recurrence_rates(index)
+        ranked = sorted(rates.items(), key=lambda item: (-item[1]['rate'], -item[1]['incidents']))
+        for component_id, counts in ranked[:args.top]:
+            print(f"component {component_id}: {counts['recurrences']}/{counts['incidents']} recur "
+                  f"({counts['rate']:.0%}, {counts['flagged']} flagged is_recurring)")
+    recurring = sum(1 for incident_id in incidents if index['previous'][incident_id] is not None)
+    print(f"{recurring} of {len(incidents)} incidents repeat an earlier one ({len(index['chains'])} chains, {elapsed * 1000:.1f} ms)")
@@ -0,0 +1,104 @@
+"""Complexity-scaling report for the generate_* stages.
+
+Runs the generator at growing scale factors (each in a fresh interpreter,
+via benchmark.py's worker), keeps the fastest of --repeat runs per stage,
+and fits log(seconds) = a + k * log(scale) by least squares. Every input
+table grows linearly with the scale factor, so k is the stage's growth
+exponent: ~1 is linear, ~2 means a nested loop over two growing tables.
+Stages with k above --max-exponent are flagged, and the fit is used to
+project each stage's time at the next scale factor.
+
+Timings vary by a fifth or more between runs on a shared machine, which
+moves a fitted exponent by up to ~0.2 over scales 1-8. So the fastest of
+--repeat runs is kept, timings under --min-seconds (mostly timer noise and
+fixed costs) are left out of the fit, and a stage is only flagged when its
+exponent exceeds --max-exponent by more than the fit's standard error. A
+stage with fewer than three timings above --min-seconds (two points give no
+error estimate) is reported as too fast to fit.
+
+    python scaling.py --scales 1 2 4 8 --repeat 3
+"""
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from benchmark import run_scale_subprocess
+
+DEFAULT_SCALES = [1, 2, 4, 8]
+DEFAULT_REPEAT = 3
+DEFAULT_MIN_SECONDS = 0.02
+
+def collect_timings(scales, repeat):
+    """Best-of-repeat seconds per stage per scale: {stage: [seconds per scale]}"""
+    timings = {}
+    for scale in scales:
+        best = {}
+        for _ in range(repeat):
+            run = run_scale_subprocess(scale)
+            for stage, step in run['stages'].items():
+                best[stage] = min(best.get(stage, float('inf')), step['seconds'])
+            write_seconds = sum(step['seconds'] for step in run['writes'].values())
+            best['(write all tables)'] = min(best.get('(write all tables)', float('inf')), write_seconds)
+        for stage, seconds in best.items():
+            timings.setdefault(stage, []).append(seconds)
+    return timings
+
+def fit_exponent(scales, seconds):
+    """Least-squares slope, intercept and slope standard error of log(seconds) against log(scale)"""
+    x = np.log(np.asarray(scales, dtype=float))
+    y = np.log(np.maximum(np.asarray(seconds, dtype=float), 1e-6))
+    slope, intercept = np.polyfit(x, y, 1)
+    stderr = 0.0
+    if len(x) > 2:
+        residuals = y - (slope * x + intercept)
+        stderr = np.sqrt(np.sum(residuals ** 2) / (len(x) - 2) / np.sum((x - x.mean()) ** 2))
+    return float(slope), float(intercept), float(stderr)
+
+def scaling_report(scales, timings, max_exponent=1.2, min_seconds=DEFAULT_MIN_SECONDS):
+    """Per-stage exponent, projection to the next scale factor and a superlinear flag"""
+    next_scale = scales[-1] * 2
+    report = {}
+    for stage, seconds in timings.items():
+        # Millisecond timings are dominated by timer noise; fit the points above it
+        fitted = [(scale, value) for scale, value in zip(scales, seconds) if value >= min_seconds]
+        measurable = len(fitted) >= 3
+        exponent, intercept, stderr = fit_exponent(*zip(*fitted)) if measurable else fit_exponent(scales, seconds)
+        report[stage] = {
+            'exponent': round(exponent, 2),
+            'exponent_stderr': round(stderr, 2),
+            'seconds': dict(zip((f"{s:g}" for s in scales), seconds)),
+            'projected_seconds': {f"{next_scale:g}": round(float(np.exp(intercept) * next_scale ** exponent), 3)},
+            'measurable': measurable,
+            'superlinear': measurable and exponent - stderr > max_exponent,
+        }
+    return report
+
+def print_report(report):
+    print(f"{'stage':<28}{'exponent':>16}{'projected':>14}  flag")
+    for stage, result in sorted(report.items(), key=lambda item: -item[1]['exponent']):
+        (scale, projected), = result['projected_seconds'].items()
+        flag = 'SUPERLINEAR' if result['superlinear'] else ('' if result['measurable'] else '(too fast to fit)')
+        exponent = f"{result['exponent']:.2f} +/- {result['exponent_stderr']:.2f}"
+        print(f"{stage:<28}{exponent:>16}{projected:>12.3f}s  {flag}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estimate how each generation stage scales")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES)
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="runs per scale; the fastest is kept")
+    parser.add_argument('--max-exponent', type=float, default=1.2, help="flag stages growing faster than this")
+    parser.add_argument('--min-seconds', type=float, default=DEFAULT_MIN_SECONDS,
+                        help="leave timings shorter than this out of the fit")
+    parser.add_argument('--output', help="write the report as JSON")
+    args = parser.parse_args()
+
+    scales = sorted(args.scales)
+    report = scaling_report(scales, collect_timings(scales, args.repeat), args.max_exponent,
+                            args.min_seconds)
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'scales': scales, 'stages': report}, f, indent=2)
+
+    sys.exit(1 if any(result['superlinear'] for result in report.values()) else 0)
@@ -0,0 +1,284 @@
+"""Running the generator's stages: scheduling, caching, checkpoints and memory.
+
+A GenerationRun runs each stage as soon as every table it reads (STAGE_READS)
+exists: one at a time in STAGES order, or with workers > 1 every ready stage
+at once in a process pool, so a run takes as long as its critical path
+(clients -> ... -> incidents -> workarounds -> incident updates) rather than
+the sum of the stages. Seeded runs produce the same tables whatever the number
+of workers.
+
+Around each stage it reuses or stores the stage's table in the content-addressed
+cache (stage_cache), saves a checkpoint (checkpoint), and with release_memory
+writes the table as soon as it is done, dropping or spilling the tables no
+remaining stage reads (liveness).
+
+RunOptions holds a run's settings; seeded2.save_all_data builds one from its
+keyword arguments.
+"""
+import json
+import os
+import sys
+import time
+
+import checkpoint
+import instrumentation
+import liveness
+import merkle
+import progress
+import sla_templates
+import stage_cache
+
+class RunOptions:
+    """Settings of one generation run; the class attributes are the defaults"""
+
+    scale = 1
+    output_dir = 'incident_management_data'
+    # Reseed every stage from this, making the run reproducible
+    seed = None
+    # Processes that run ready stages (and generate_incidents' components) at once
+    workers = 1
+    # Generate only these tables and the ones they read, directly or transitively
+    tables = None
+    # Also run EXPORT_STAGES, the derived tables such as incident_view
+    views = False
+    # Write a per-stage timing/memory report here as JSON (see instrumentation)
+    profile = None
+    # Dump a cProfile file per stage into this directory
+    cprofile_dir = None
+    # Show live progress on stderr; None shows it when stderr is a terminal. Stages run in
+    # pool workers (workers > 1) only report when they finish, with no ETA (see progress)
+    show_progress = None
+    # Export Prometheus-format progress metrics to this file and/or port (see progress)
+    metrics_file = None
+    metrics_port = None
+    # Save each finished stage here and resume from it when rerun with the same scale and seed
+    checkpoint_dir = None
+    # Reuse cached tables whose seed, scale, code and inputs are unchanged (needs a seed)
+    cache_dir = None
+    # Trim the cache to this size afterwards, least recently used first (this run's entries are kept)
+    cache_max_bytes = stage_cache.DEFAULT_MAX_BYTES
+    # Write each table when its stage finishes and drop it once no remaining stage reads it
+    release_memory = False
+    # Bytes; implies release_memory and spills live tables no running stage needs when over it
+    memory_budget = None
+    # Write sla_agreements as sla_templates.json (see sla_templates)
+    compact_sla = False
+    # 'compact' writes every table as <table>.compact.json (see compact_json)
+    output_format = 'json'
+    # Store a Merkle tree of each table beside it for dataset_diff.py (see merkle)
+    merkle_trees = False
+
+    def __init__(self, **options):
+        for name, value in options.items():
+            if not hasattr(RunOptions, name) or name.startswith('_'):
+                raise TypeError(f"unknown run option: {name}")
+            setattr(self, name, value)
+        if self.memory_budget is not None:
+            self.release_memory = True
+        if self.cache_dir and self.seed is None:
+            raise ValueError("cache_dir needs a seed: unseeded runs never produce the same table twice")
+
+class GenerationRun:
+    """One run of the given stages of generator (the seeded2 module) into generator.data"""
+
+    def __init__(self, generator, stages, options):
+        self.generator = generator
+        self.data = generator.data
+        self.reads = generator.STAGE_READS
+        self.stages = stages
+        self.options = options
+
+        self.manifest = None
+        if options.checkpoint_dir:
+            self.manifest = checkpoint.start(options.checkpoint_dir, {'scale': options.scale, 'seed': options.seed})
+            if self.manifest['completed']:
+                restored, state = checkpoint.restore(options.checkpoint_dir, self.manifest)
+                self.data.update((table_name, restored[table_name])
+                                 for table_name, _, _ in stages if table_name in restored)
+                generator.set_rng_state(state)
+                print(f"Resuming from {options.checkpoint_dir}: "
+                      f"{len(self.data)} of {len(stages)} stages already complete")
+
+        self.finished = set(self.data)
+        self.row_counts = {table_name: len(self.data[table_name]) for table_name in self.finished}
+        self.pending = [stage for stage in stages if stage[0] not in self.finished]
+        self.running = {}
+        self.readers = liveness.remaining_readers(self.pending, self.reads)
+        self.spill = liveness.start_spill(options.memory_budget) if options.memory_budget is not None else None
+
+        self.report = None
+        if options.profile or options.cprofile_dir:
+            self.report = instrumentation.start_report(
+                scale=options.scale, output_dir=options.output_dir, seed=options.seed, workers=options.workers,
+                resumed_stages=sorted(self.finished), memory_budget=options.memory_budget
+            )
+
+        show_progress = options.show_progress
+        if show_progress is None:
+            show_progress = sys.stderr.isatty()
+        if show_progress or options.metrics_file or options.metrics_port is not None:
+            progress.start_run(len(stages), terminal=show_progress, metrics_file=options.metrics_file,
+                               metrics_port=options.metrics_port, stages_done=len(self.finished))
+
+        self.stage_keys = self.cache_keys() if options.cache_dir else {}
+
+    def cache_keys(self):
+        """{table: cache key} for every stage, from the seed, scale, stage code and upstream keys"""
+        generator = self.generator
+        keys = {}
+        for table_name, generate, _ in generator.STAGES + generator.EXPORT_STAGES:
+            keys[table_name] = stage_cache.stage_key(
+                self.options.seed, {'scale': float(self.options.scale)}, table_name,
+                stage_cache.source_hash(generate, *generator.STAGE_HELPERS.get(table_name, []),
+                                        *generator.SHARED_CODE),
+                [keys[upstream] for upstream in self.reads[table_name]]
+            )
+        return keys
+
+    def write_output(self, table_name):
+        options = self.options
+        table = self.data[table_name]
+        start = time.perf_counter()
+        if options.compact_sla and table_name == 'sla_agreements':
+            filename = self.generator.write_table('sla_templates', sla_templates.compact(table),
+                                                  options.output_dir, indent=None)
+        else:
+            filename = self.generator.write_table(table_name, table, options.output_dir,
+                                                  output_format=options.output_format)
+        if options.merkle_trees:
+            merkle.save(merkle.build(table), table_name, options.output_dir)
+        if self.report:
+            instrumentation.record_write(self.report, table_name, filename, time.perf_counter() - start)
+        print(f"Generated {filename} with {self.row_counts[table_name]} records")
+
+    def release(self, table_name, resumed=False):
+        """Write a finished table and drop whatever no remaining stage reads"""
+        self.write_output(table_name)
+        dead = [table_name] if self.readers.get(table_name, 0) == 0 else []
+        if not resumed:
+            dead += liveness.finish_reads(self.readers, self.reads[table_name])
+        for upstream in dead:
+            self.data.pop(upstream, None)
+            if self.spill:
+                liveness.forget(self.spill, upstream)
+        if self.spill and table_name in self.data:
+            liveness.track(self.spill, self.data, table_name)
+            next_use = {}
+            for position, (pending_table, _, _) in enumerate(self.pending):
+                for upstream in self.reads[pending_table]:
+                    next_use.setdefault(upstream, position)
+            protected = {upstream for running_table in self.running.values()
+                         for upstream in self.reads[running_table]}
+            liveness.enforce_budget(self.spill, self.data, next_use, protected)
+
+    def stage_done(self, table_name, cached=False):
+        options = self.options
+        table = self.data[table_name]
+        self.finished.add(table_name)
+        self.row_counts[table_name] = len(table)
+        progress.finish_stage(len(table), table_name)
+        if options.cache_dir and not cached:
+            stage_cache.store(options.cache_dir, self.stage_keys[table_name], table)
+        if self.manifest is not None:
+            checkpoint.save_stage(options.checkpoint_dir, self.manifest, table_name, table,
+                                  self.generator.rng_state())
+        if options.release_memory:
+            self.release(table_name)
+        if self.report:
+            instrumentation.record_retained(self.report, table_name, self.data)
+
+    def start_stage(self, stage, pool):
+        """Load a stage's table from the cache, submit it to the pool or generate it here"""
+        options = self.options
+        table_name, generate, label = stage
+        progress.start_stage(table_name)
+        cached = stage_cache.load(options.cache_dir, self.stage_keys[table_name]) if options.cache_dir else None
+        if cached is not None:
+            print(f"Reusing cached {label}...")
+            self.data[table_name] = cached
+            self.stage_done(table_name, cached=True)
+            return
+        print(f"Generating {label}...")
+        if self.spill:
+            liveness.ensure_loaded(self.spill, self.data, self.reads[table_name])
+        if pool is not None:
+            inputs = {upstream: self.data[upstream] for upstream in self.reads[table_name]}
+            future = pool.submit(self.generator.run_stage_worker, table_name, inputs, options.scale, options.seed,
+                                 self.report is not None, options.cprofile_dir, options.workers)
+            self.running[future] = table_name
+            return
+        if options.seed is not None:
+            self.generator.seed_stage(options.seed, table_name)
+        if self.report:
+            # Build Faker outside the stage's timing
+            self.generator.fake.build()
+            instrumentation.run_stage(self.report, table_name, generate, self.data, options.cprofile_dir)
+        else:
+            generate()
+        self.stage_done(table_name)
+
+    def collect(self):
+        """Wait for at least one pool stage to finish and record its table"""
+        import concurrent.futures
+
+        completed, _ = concurrent.futures.wait(self.running, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in completed:
+            table_name = self.running.pop(future)
+            self.data[table_name], stats = future.result()
+            if self.report:
+                self.report['stages'][table_name] = stats
+            self.stage_done(table_name)
+
+    def run(self):
+        """Run the pending stages, write every table and return the profile report (or None)"""
+        import concurrent.futures
+
+        options = self.options
+        os.makedirs(options.output_dir, exist_ok=True)
+        pool = None
+        if options.workers > 1:
+            pool = concurrent.futures.ProcessPoolExecutor(options.workers, initializer=self.generator.init_worker)
+        run_start = time.perf_counter()
+        try:
+            if options.release_memory:
+                for table_name in [stage[0] for stage in self.stages if stage[0] in self.finished]:
+                    self.release(table_name, resumed=True)
+            while self.pending or self.running:
+                ready = [stage for stage in self.pending
+                         if all(upstream in self.finished for upstream in self.reads[stage[0]])]
+                if pool is None:
+                    ready = ready[:1]
+                for stage in ready:
+                    self.pending.remove(stage)
+                    self.start_stage(stage, pool)
+                if ready:
+                    continue
+                if not self.running:
+                    raise RuntimeError(f"stages {[stage[0] for stage in self.pending]} read tables no stage produces")
+                self.collect()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            if self.spill:
+                liveness.finish_spill(self.spill)
+        generate_seconds = time.perf_counter() - run_start
+        if options.cache_dir:
+            stage_cache.evict(options.cache_dir, options.cache_max_bytes, keep=set(self.stage_keys.values()))
+
+        if not options.release_memory:
+            for table_name, _, _ in self.stages:
+                self.write_output(table_name)
+        progress.finish_run()
+
+        print("\nData generation complete!")
+        print(f"Total tables generated: {len(self.stages)}")
+        for table_name, _, _ in self.stages:
+            print(f"  {table_name}: {self.row_counts[table_name]} records")
+
+        if self.report:
+            instrumentation.finish_report(self.report, generate_seconds)
+            if options.profile:
+                with open(options.profile, 'w', encoding='utf-8') as f:
+                    json.dump(self.report, f, indent=2)
+                print(f"Profile report written to {options.profile}")
+        return self.report
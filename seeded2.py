@@ -1,21 +1,71 @@
+import argparse
 import json
 import re
 import random
-from datetime import datetime, timedelta, date
-from faker import Faker
+import sys
+from datetime import datetime, timedelta
 import uuid
 
-# Initialize Faker
-fake = Faker()
+import catalogs
+import compact_json
+import incident_view
+import instrumentation
+import progress
+import scheduler
+from catalogs import (
+    area_codes, cloud_regions, component_category_map, component_types_by_product, countries, datacenters,
+    departments_by_role, email_domains, escalation_level_by_role, fallback_titles, impact_urgency_by_severity,
+    incident_category_map, industries_by_type, kb_categories, product_types_by_vendor, recipient_type_by_role,
+    sla_availability_percentages, sla_resolution_times, sla_response_times, tech_terms, titles_by_component,
+    vendor_types_names,
+)
+
+class LazyFaker:
+    """Stands in for a Faker instance; Faker is imported and built on first use
+
+    Building Faker and its providers is most of this module's import time, and
+    tools that only want the helpers, STAGES or the catalogues never need it.
+    seed_instance() before then is remembered and applied once Faker is built,
+    so seeding a stage or a pool worker does not build it either.
+    """
+
+    def __init__(self):
+        self.instance = None
+        self.pending_seed = None
+
+    def build(self):
+        """The Faker instance, imported, built and seeded now if it was not yet"""
+        if self.instance is None:
+            from faker import Faker
+            self.instance = Faker()
+            if self.pending_seed is not None:
+                self.instance.seed_instance(*self.pending_seed)
+        return self.instance
+
+    def seed_instance(self, seed=None):
+        if self.instance is None:
+            self.pending_seed = (seed,)
+        else:
+            self.instance.seed_instance(seed)
+
+    def __getattr__(self, name):
+        return getattr(self.build(), name)
+
+# Initialize Faker (lazily)
+fake = LazyFaker()
 
 # Global data storage
 data = {}
 
-# Email domains for realistic email generation
-email_domains = ['gmail.com', 'outlook.com', 'yahoo.com', 'company.com', 'business.net', 'corp.org']
+# The dataset's as-of moment. Relative dates ("two years ago") are measured from here
+# rather than from the wall clock, so a run (or a resumed run) is reproducible
+REFERENCE_DATE = datetime(2025, 8, 31, 23, 59, 59)
+
+# Multiplier applied to base entity counts and minimum row targets (1 = the original dataset size)
+scale_factor = 1
 
-# Phone number area codes
-area_codes = ['202', '212', '213', '214', '305', '312', '404', '415', '503', '617', '718', '832']
+# Processes a partitioned stage (generate_incidents) may split its work across
+stage_workers = 1
 
 def generate_phone():
     """Generate realistic phone number"""
@@ -40,14 +90,14 @@ def generate_email(first_name, last_name, domain=None):
 
 def generate_timestamps(base_date=None, days_range=365):
     """Generate created_at and updated_at timestamps - no dates beyond Aug 31, 2025"""
-    max_date = datetime(2025, 8, 31, 23, 59, 59)
+    max_date = REFERENCE_DATE
     
     if base_date is None:
-        base_date = fake.date_time_between(start_date='-2y', end_date=max_date)
+        base_date = fake.date_time_between(start_date=max_date - timedelta(days=730), end_date=max_date)
     
     created_at = base_date
     # Ensure updated_at doesn't go beyond Aug 31, 2025
-    updated_at = fake.date_time_between(start_date=created_at, end_date=min(datetime.now(), max_date))
+    updated_at = fake.date_time_between(start_date=created_at, end_date=max_date)
     
     return created_at.isoformat(), updated_at.isoformat()
 
@@ -55,6 +105,10 @@ def slugify(name):
     """Helper to convert company name into domain-friendly slug"""
     return re.sub(r'[^a-z0-9]', '', name.lower())
 
+def scaled(count):
+    """Scale a base row count by the current scale factor"""
+    return max(1, int(round(count * scale_factor)))
+
 def generate_clients():
     """Generate clients data - at least 100 entries with uniqueness and alignment"""
     clients = {}
@@ -63,21 +117,9 @@ def generate_clients():
     used_phones = set()
     used_registration_numbers = set()
     
-    industries_by_type = {
-        'enterprise': ['Aerospace', 'Automotive', 'Government', 'Energy', 'Telecommunications', 'Financial Services'],
-        'mid_market': ['Manufacturing', 'Insurance', 'Healthcare', 'Real Estate', 'Technology'],
-        'small_business': ['Retail', 'Food & Beverage', 'Construction', 'Hospitality'],
-        'startup': ['Technology', 'Biotechnology', 'Media', 'Education', 'Fintech']
-    }
-
     email_prefixes = ["contact", "support", "info", "hello", "admin"]
 
-    countries = [
-        'United States', 'Canada', 'United Kingdom', 'Germany', 'France',
-        'Australia', 'Japan', 'Brazil', 'India', 'Mexico'
-    ]
-    
-    for i in range(1, 121):  # 120 clients
+    for i in progress.track(range(1, scaled(120) + 1), 'clients'):  # 120 clients at scale 1
         # Ensure unique company name
         while True:
             client_name = fake.company()
@@ -143,35 +185,16 @@ def generate_vendors():
     used_emails = set()
     used_phones = set()
     
-    vendor_types_names = {
-        'cloud_provider': [
-            'AOS Cloud', 'Azurian Cloud Services', 'Goggle Cloud Platform',
-            'IBM Nimbus', 'Orcale Cloud', 'DigitalOceanic', 'LinodeX', 'Vulturis'
-        ],
-        'payment_processor': [
-            'Stripee', 'PayPole', 'Squarix Payments', 'Adyant',
-            'Worldpayz', 'Authorize.NetX', 'Braintreee', 'Klarno'
-        ],
-        'software_vendor': [
-            'Microcraft', 'Orcale Systems', 'SAPhia Solutions',
-            'SalesForza', 'Adobix', 'Atlasian', 'ServiceNowo', 'Workdaze'
-        ],
-        'infrastructure_provider': [
-            'Cysco Systems', 'VMwere', 'Red Hatchet', 'Dockar Inc',
-            'HashyCorp', 'Kubernetix', 'Terrafirm', 'Ansiblee'
-        ],
-        'security_vendor': [
-            'CrowdStrik3', 'Palo Alto Netwerks', 'Symantix',
-            'McAfree', 'Fortanett', 'CheckPoynt', 'Splonq', 'Oktra'
-        ]
-    }
-
     suffixes = ["Technologies", "Solutions", "Systems", "Services", "Networks"]
 
     email_prefixes = ["support", "info", "sales", "contact", "admin"]
 
-    for i in range(1, 101):  # 100 vendors
+    # Number of distinct names the catalogue can produce (each base name, bare or with a suffix)
+    catalogue_size = sum(len(names) for names in vendor_types_names.values()) * (len(suffixes) + 1)
+
+    for i in progress.track(range(1, scaled(100) + 1), 'vendors'):  # 100 vendors at scale 1
         # Ensure unique vendor name
+        attempts = 0
         while True:
             vendor_type = random.choice(list(vendor_types_names.keys()))
             base_name = random.choice(vendor_types_names[vendor_type])
@@ -179,6 +202,12 @@ def generate_vendors():
             if vendor_name not in used_names:
                 used_names.add(vendor_name)
                 break
+            attempts += 1
+            if attempts >= 200 or len(used_names) >= catalogue_size:
+                # Name catalogue exhausted at larger scale factors - disambiguate with the vendor number
+                vendor_name = f"{vendor_name} {i}"
+                used_names.add(vendor_name)
+                break
         
         # Domain derived from vendor name
         domain = f"{slugify(base_name)}.com"
@@ -218,35 +247,23 @@ def generate_users():
     clients = data['clients']
     vendors = data['vendors']
     
-    departments_by_role = {
-        'incident_manager': ['Operations', 'IT Support', 'Technical Operations'],
-        'technical_support': ['Technical Support', 'Engineering', 'IT Operations'],
-        'account_manager': ['Account Management', 'Customer Success', 'Business Development'],
-        'executive': ['Executive', 'Management', 'Leadership'],
-        'system_administrator': ['IT Administration', 'System Operations', 'Infrastructure'],
-        'client_contact': lambda industry: [
-            f"{industry} Operations", f"{industry} IT", "Business Operations"
-        ],
-        'vendor_contact': lambda vendor_type: [
-            f"{vendor_type.replace('_', ' ').title()} Support",
-            "Technical Account Management", "Customer Success"
-        ]
-    }
-    
     user_id = 1
     
     # --------------------
     # Internal employees
     # --------------------
-    for i in range(120):  # 120 internal employees
+    internal_roles = ['incident_manager', 'technical_support', 'account_manager', 'executive', 'system_administrator']
+
+    def add_employee(role=None, status=None):
+        nonlocal user_id
         first_name = fake.first_name()
         last_name = fake.last_name()
-        role = random.choice(['incident_manager', 'technical_support', 'account_manager', 'executive', 'system_administrator'])
+        role = role or random.choice(internal_roles)
         department = random.choice(departments_by_role[role])
         created_at, updated_at = generate_timestamps()
         
         # 75% active, 15% inactive, 10% on_leave
-        status = random.choices(
+        status = status or random.choices(
             ['active', 'inactive', 'on_leave'],
             weights=[75, 15, 10]
         )[0]
@@ -267,6 +284,16 @@ def generate_users():
             'updated_at': updated_at
         }
         user_id += 1
+
+    for i in range(scaled(120)):  # 120 internal employees at scale 1
+        add_employee()
+
+    # Later stages pick approvers, facilitators, ... from the active users of a role, often
+    # someone other than the requester, so at small scales every role is topped up to two
+    for role in internal_roles:
+        active = sum(1 for user in users.values() if user['role'] == role and user['status'] == 'active')
+        for i in range(2 - active):
+            add_employee(role, 'active')
     
     # --------------------
     # Client users
@@ -353,25 +380,15 @@ def generate_products():
     used_product_names = set()
 
     def generate_unique_product_name(vendor_name, tech_terms, buzzwords):
-        while True:
+        for _ in range(200):
             name = f"{vendor_name.split()[0]} {random.choice(tech_terms)} {random.choice(buzzwords)}"
             if name not in used_product_names:
                 used_product_names.add(name)
                 return name
-
-    product_types_by_vendor = {
-        'cloud_provider': ['api_gateway', 'data_integration', 'monitoring_tool', 'backup_service'],
-        'payment_processor': ['payment_processing', 'api_gateway'],
-        'software_vendor': ['banking_system', 'reporting_platform', 'data_integration'],
-        'infrastructure_provider': ['monitoring_tool', 'security_service', 'backup_service'],
-        'security_vendor': ['security_service', 'monitoring_tool']
-    }
-
-    tech_terms = [
-        "Nova", "Orion", "Zenith", "Apex", "Nimbus", "Pulse", "Quantum",
-        "Vertex", "Horizon", "Stratus", "Vector", "Helix", "Axis",
-        "Catalyst", "Core", "Stream", "Fusion", "Lumen", "Echo", "Forge"
-    ]
+        # All combinations for this vendor prefix are taken at larger scale factors
+        name = f"{name} {len(used_product_names) + 1}"
+        used_product_names.add(name)
+        return name
 
     buzzwords = ["Suite", "Engine", "Service", "Cloud", "Matrix", "Portal", "Hub", "Edge", "Flow", "Core", "Stream", "Fabric"]
     
@@ -404,7 +421,7 @@ def generate_products():
                 product_id += 1
     
     # Generate additional products to reach at least 100
-    while product_id <= 100:
+    while product_id <= scaled(100):
         vendor = random.choice([v for v in vendors.values() if v['status'] == 'active'])
         product_type = random.choice(product_types_by_vendor[vendor['vendor_type']])
         created_at, updated_at = generate_timestamps()
@@ -430,7 +447,7 @@ def generate_products():
     
     # Add some deprecated products for inactive vendors
     inactive_vendors = [v for v in vendors.values() if v['status'] in ['inactive', 'suspended']]
-    for vendor in inactive_vendors[:10]:  # First 10 inactive vendors
+    for vendor in inactive_vendors[:scaled(10)]:  # First 10 inactive vendors at scale 1
         product_type = random.choice(product_types_by_vendor[vendor['vendor_type']])
         created_at, updated_at = generate_timestamps()
         
@@ -456,27 +473,8 @@ def generate_infrastructure_components():
     components = {}
     products = data['products']
     
-    component_types_by_product = {
-        'payment_processing': ['payment_gateway', 'api_endpoint', 'database'],
-        'banking_system': ['database', 'api_endpoint', 'authentication_service'],
-        'api_gateway': ['api_endpoint', 'load_balancer', 'firewall'],
-        'data_integration': ['sftp_server', 'api_endpoint', 'database'],
-        'reporting_platform': ['database', 'api_endpoint', 'file_storage'],
-        'security_service': ['firewall', 'authentication_service', 'monitoring_system'],
-        'backup_service': ['file_storage', 'sftp_server', 'monitoring_system'],
-        'monitoring_tool': ['monitoring_system', 'api_endpoint', 'database']
-    }
-
-    cloud_regions = [
-        "aws-us-east-1", "aws-us-west-2", "gcp-europe-west3", 
-        "azure-centralus", "aws-ap-southeast-1"
-    ]
-    datacenters = [
-        "NYC-DC1", "SFO-DC2", "LON-DC3", "FRA-DC4", "SGP-DC5"
-    ]
-    
     component_id = 1
-    for product_id, product in products.items():
+    for product_id, product in progress.track(products.items(), 'products'):
         possible_components = component_types_by_product[product['product_type']]
         num_components = min(len(possible_components), random.randint(2, 4))
         
@@ -537,26 +535,27 @@ def generate_client_subscriptions():
     all_clients = list(clients.values())
     all_products = list(products.values())
 
-    TODAY = date(2025, 8, 31)  # Set to Aug 31 as absolute maximum
+    TODAY = REFERENCE_DATE.date()  # Set to Aug 31 as absolute maximum
+    ONE_YEAR, SIX_MONTHS = timedelta(days=365), timedelta(days=182)
 
     def generate_subscription_dates(status):
         """Generate start and end dates - no dates beyond Aug 31, 2025"""
         if status == 'active':
-            start_date = fake.date_between(start_date='-2y', end_date='-1y')
+            start_date = fake.date_between(start_date=TODAY - 2 * ONE_YEAR, end_date=TODAY - ONE_YEAR)
             # End dates can extend beyond Aug 31 for active subscriptions
             end_date = fake.date_between(start_date=TODAY + timedelta(days=30),
                                         end_date=TODAY + timedelta(days=365))
         elif status in ['expired', 'cancelled']:
-            start_date = fake.date_between(start_date='-3y', end_date='-2y')
+            start_date = fake.date_between(start_date=TODAY - 3 * ONE_YEAR, end_date=TODAY - 2 * ONE_YEAR)
             end_date = fake.date_between(start_date=start_date + timedelta(days=180),
                                         end_date=TODAY)  # Must end by Aug 31
         elif status == 'suspended':
-            start_date = fake.date_between(start_date='-2y', end_date='-6m')
+            start_date = fake.date_between(start_date=TODAY - 2 * ONE_YEAR, end_date=TODAY - SIX_MONTHS)
             # Can extend beyond Aug 31 for suspended (future reactivation)
             end_date = fake.date_between(start_date=TODAY - timedelta(days=30),
                                         end_date=TODAY + timedelta(days=365))
         else:
-            start_date = fake.date_between(start_date='-2y', end_date='-6m')
+            start_date = fake.date_between(start_date=TODAY - 2 * ONE_YEAR, end_date=TODAY - SIX_MONTHS)
             end_date = fake.date_between(start_date=start_date + timedelta(days=365),
                                         end_date=TODAY + timedelta(days=365))
         return start_date, end_date
@@ -574,7 +573,7 @@ def generate_client_subscriptions():
             return 'cancelled'
     
     # Ensure each client has 1–3 subscriptions
-    for client in all_clients:
+    for client in progress.track(all_clients, 'clients'):
         num_subscriptions = random.randint(1, 3)
         selected_products = random.sample(all_products, min(num_subscriptions, len(all_products)))
         
@@ -599,7 +598,7 @@ def generate_client_subscriptions():
             subscription_id += 1
     
     # Ensure at least 100
-    while subscription_id <= 100:
+    while subscription_id <= scaled(100):
         client = random.choice(all_clients)
         product = random.choice(all_products)
         created_at, updated_at = generate_timestamps()
@@ -631,32 +630,11 @@ def generate_sla_agreements():
     subscriptions = data['client_subscriptions']
     
     sla_id = 1
-    for subscription_id, subscription in subscriptions.items():
+    for subscription_id, subscription in progress.track(subscriptions.items(), 'subscriptions'):
         # Generate SLA for each severity level
         severities = ['P1', 'P2', 'P3', 'P4']
         tier = subscription['sla_tier']
         
-        # Updated response times by tier (in minutes) - matching your specifications
-        response_times = {
-            'premium': {'P1': 15, 'P2': 60, 'P3': 240, 'P4': 1440},      # 15min, 1hr, 4hr, 24hr
-            'standard': {'P1': 60, 'P2': 240, 'P3': 1440, 'P4': 2880},   # 1hr, 4hr, 24hr, 48hr
-            'basic': {'P1': 240, 'P2': 1440, 'P3': 2880, 'P4': 7200}     # 4hr, 24hr, 48hr, 120hr
-        }
-        
-        # Updated resolution times by tier (in hours) - P4 now has values
-        resolution_times = {
-            'premium': {'P1': 2, 'P2': 8, 'P3': 48, 'P4': 120},          # 2hr, 8hr, 48hr, 120hr
-            'standard': {'P1': 8, 'P2': 24, 'P3': 72, 'P4': 168},        # 8hr, 24hr, 72hr, 168hr (1 week)
-            'basic': {'P1': 24, 'P2': 72, 'P3': 240, 'P4': 336}          # 24hr, 72hr, 240hr, 336hr (2 weeks)
-        }
-        
-        # Availability percentages by tier
-        availability_percentages = {
-            'premium': 99.9,
-            'standard': 99.5,
-            'basic': 99.0
-        }
-        
         for severity in severities:
             created_at, _ = generate_timestamps()
             
@@ -664,9 +642,9 @@ def generate_sla_agreements():
                 'sla_id': str(sla_id),
                 'subscription_id': subscription_id,
                 'severity_level': severity,
-                'response_time_minutes': response_times[tier][severity],
-                'resolution_time_hours': resolution_times[tier][severity],
-                'availability_percentage': availability_percentages[tier],
+                'response_time_minutes': sla_response_times[tier][severity],
+                'resolution_time_hours': sla_resolution_times[tier][severity],
+                'availability_percentage': sla_availability_percentages[tier],
                 'created_at': created_at
             }
             sla_id += 1
@@ -674,27 +652,8 @@ def generate_sla_agreements():
     data['sla_agreements'] = sla_agreements
     return sla_agreements
 
-def ensure_diverse_incident_distribution():
-    """Ensure we have good distribution across tiers, products, and severities"""
-    components = data['infrastructure_components']
-    subscriptions = data['client_subscriptions']
-    
-    # Create component groups by subscription tier
-    components_by_tier = {'premium': [], 'standard': [], 'basic': []}
-    
-    for comp_id, comp in components.items():
-        # Find subscription for this component's product
-        for sub_id, sub in subscriptions.items():
-            if sub['product_id'] == comp['product_id']:
-                tier = sub['sla_tier']
-                components_by_tier[tier].append(comp_id)
-                break
-    
-    return components_by_tier
-
-def generate_incidents():
-    """Generate incidents with realistic SLA-aligned timing and many recent incidents around Aug 31, 2025"""
-    incidents = {}
+def incident_lookups():
+    """Read-only lookups shared by every component's incidents"""
     users = data['users']
     clients = data['clients']
     components = data['infrastructure_components']
@@ -702,25 +661,11 @@ def generate_incidents():
     subscriptions = data['client_subscriptions']
     sla_agreements = data['sla_agreements']
 
-    # Create lookup maps
-    reporters = [u for u in users.values() if u['status'] == 'active']
-    managers = [u for u in users.values() if u['status'] == 'active' and u['role'] == 'incident_manager']
-    
-    active_clients = [c for c in clients.values() if c['status'] == 'active']
-    inactive_clients = [c for c in clients.values() if c['status'] == 'inactive']
-    suspended_clients = [c for c in clients.values() if c['status'] == 'suspended']
+    # Create subscription lookup by component (the last subscription listed for a product wins)
+    subscription_by_product = {}
+    for sub in subscriptions.values():
+        subscription_by_product[sub['product_id']] = sub
 
-    product_by_id = {p['product_id']: p for p in products.values()}
-    
-    # Create subscription lookup by component
-    subscription_by_component = {}
-    for sub_id, sub in subscriptions.items():
-        product_id = sub['product_id']
-        # Find components for this product
-        for comp_id, comp in components.items():
-            if comp['product_id'] == product_id:
-                subscription_by_component[comp_id] = sub
-    
     # Create SLA lookup by subscription and severity
     sla_by_subscription = {}
     for sla_id, sla in sla_agreements.items():
@@ -730,98 +675,35 @@ def generate_incidents():
             sla_by_subscription[sub_id] = {}
         sla_by_subscription[sub_id][severity] = sla
 
-    # Title catalog
-    titles_by_component = {
-        'api_endpoint': {
-            'performance_issue': [
-                'High API Latency Detected', '5xx Error Spike on API', 'Rate Limit Saturation'
-            ],
-            'integration_failure': [
-                'API Connection Failed', 'Webhook Delivery Failures', 'OAuth Token Rejected'
-            ],
-            'system_outage': [
-                'API Unavailable', 'Routing Failure to API', 'DNS Resolution Failure for API'
-            ],
-        },
-        'payment_gateway': {
-            'vendor_issue': [
-                'Payment Authorization Failures', 'High Decline Rates from Processor', 'Settlement Delay from Vendor'
-            ],
-            'performance_issue': [
-                'Gateway Timeout Errors', 'Increased Transaction Latency', 'Intermittent Capture Failures'
-            ],
-            'system_outage': [
-                'Gateway Unreachable', 'Processor Endpoint Down', 'Critical Gateway Connectivity Loss'
-            ],
-        },
-        'database': {
-            'data_update': [
-                'Schema Migration Error', 'Record Corruption Detected', 'Write Conflicts Observed'
-            ],
-            'performance_issue': [
-                'Replication Lag High', 'Connection Pool Exhausted', 'Deadlocks Detected'
-            ],
-            'system_outage': [
-                'Primary Database Unavailable', 'Failover Did Not Trigger', 'Storage Volume Not Mounted'
-            ],
-        },
-        'load_balancer': {
-            'system_outage': [
-                'LB Health Checks Failing', 'VIP Not Reachable', 'Listener Crash on LB'
-            ],
-            'performance_issue': [
-                'Uneven Traffic Distribution', 'SSL Termination Failures', 'Session Stickiness Broken'
-            ],
-        },
-        'firewall': {
-            'security_breach': [
-                'Unusual Port Scans Detected', 'Unauthorized Access Attempt Blocked', 'Inbound Traffic Spike'
-            ],
-            'integration_failure': [
-                'Firewall Blocking Legitimate Traffic', 'Rule Misconfiguration', 'Outbound Port Blocked'
-            ],
-        },
-        'authentication_service': {
-            'security_breach': [
-                'Multiple Failed Login Attempts', 'Suspicious SSO Activity', 'Brute Force Attempt Detected'
-            ],
-            'client_support': [
-                'SSO Login Failures', 'Token Expiry Mismatch', 'MFA Provider Timeout'
-            ],
-        },
-        'sftp_server': {
-            'data_update': [
-                'SFTP Upload Permission Denied', 'Key Exchange Failure', 'Partial Transfers Detected'
-            ],
-            'integration_failure': [
-                'SFTP Connection Timeout', 'Host Key Mismatch', 'Batch Job Could Not Connect to SFTP'
-            ],
-        },
-        'file_storage': {
-            'data_update': [
-                'File Corruption Detected', 'Checksum Mismatch on Object', 'Stale Snapshot Restored'
-            ],
-            'performance_issue': [
-                'Object Store Latency', 'Slow Reads from Storage', 'Write Throughput Degradation'
-            ],
-        },
-        'monitoring_system': {
-            'performance_issue': [
-                'Dashboard Query Latency', 'Timeseries Backfill Lag', 'Indexing Queue Backlog', 
-                'Alert Flood from Multiple Sources', 'Agent Offline Across Nodes', 'Metrics Ingestion Delay'
-            ],
+    return {
+        'reporters': [u for u in users.values() if u['status'] == 'active'],
+        'managers': [u for u in users.values() if u['status'] == 'active' and u['role'] == 'incident_manager'],
+        'all_users': list(users.values()),
+        'active_clients': [c for c in clients.values() if c['status'] == 'active'],
+        'inactive_clients': [c for c in clients.values() if c['status'] == 'inactive'],
+        'suspended_clients': [c for c in clients.values() if c['status'] == 'suspended'],
+        'all_clients': list(clients.values()),
+        'product_by_id': {p['product_id']: p for p in products.values()},
+        'subscription_by_component': {
+            comp_id: subscription_by_product[comp['product_id']]
+            for comp_id, comp in components.items()
+            if comp['product_id'] in subscription_by_product
         },
+        'sla_by_subscription': sla_by_subscription,
     }
 
-    fallback_titles = {
-        'performance_issue': ['Slow Response Times', 'High Latency Detected', 'Resource Exhaustion'],
-        'system_outage': ['Service Unavailable', 'Network Connectivity Lost', 'Complete System Down'],
-        'integration_failure': ['Third-party Service Down', 'Data Flow Interrupted', 'API Connection Failed'],
-        'security_breach': ['Unauthorized Access Detected', 'Suspicious Activity', 'Data Breach Alert'],
-        'data_update': ['Data Sync Failed', 'Database Update Error', 'Record Corruption'],
-        'client_support': ['Login Issues', 'Access Configuration Issue', 'User Provisioning Error'],
-        'vendor_issue': ['Vendor Service Outage', 'Third-party Performance Issues', 'Vendor Communication Error'],
-    }
+def generate_component_incidents(comp, lookups):
+    """Incidents for one component; they depend only on the component and the shared lookups"""
+    reporters = lookups['reporters']
+    managers = lookups['managers']
+    all_users = lookups['all_users']
+    active_clients = lookups['active_clients']
+    inactive_clients = lookups['inactive_clients']
+    suspended_clients = lookups['suspended_clients']
+    all_clients = lookups['all_clients']
+    product_by_id = lookups['product_by_id']
+    subscription_by_component = lookups['subscription_by_component']
+    sla_by_subscription = lookups['sla_by_subscription']
 
     def pick_category_and_title(component_type):
         buckets = titles_by_component.get(component_type, {})
@@ -834,13 +716,7 @@ def generate_incidents():
         return cat, title
 
     def severity_to_impact_urgency(sev):
-        mapping = {
-            'P1': ('critical', 'critical'),
-            'P2': ('high', 'high'),
-            'P3': ('medium', 'medium'),
-            'P4': ('low', 'low')
-        }
-        return mapping[sev]
+        return impact_urgency_by_severity[sev]
 
     def choose_severity():
         return random.choices(['P1', 'P2', 'P3', 'P4'], weights=[10, 20, 40, 30])[0]
@@ -859,8 +735,7 @@ def generate_incidents():
         
         # For incidents around Aug 31, 2025 - 80% chance of meeting SLA for recent ones
         # Historical incidents have normal 70% chance
-        target_date = datetime(2025, 8, 31)
-        days_from_target = abs((detected_at.date() - target_date.date()).days)
+        days_from_target = abs((detected_at.date() - REFERENCE_DATE.date()).days)
         
         if days_from_target <= 7:  # Recent incidents around Aug 31
             meets_sla = random.random() < 0.8  # Higher success rate
@@ -902,14 +777,12 @@ def generate_incidents():
                 return random.choice(inactive_clients)
             if pool_choice == 'suspended' and suspended_clients:
                 return random.choice(suspended_clients)
-            return random.choice(active_clients) if active_clients else random.choice(list(clients.values()))
+            return random.choice(active_clients) if active_clients else random.choice(all_clients)
         else:
-            return random.choice(active_clients) if active_clients else random.choice(list(clients.values()))
+            return random.choice(active_clients) if active_clients else random.choice(all_clients)
 
-    incident_id = 1
-    
     # Set target date to August 31, 2025 - NO DATES BEYOND THIS
-    target_date = datetime(2025, 8, 31, 23, 59, 59)
+    target_date = REFERENCE_DATE
 
     # Define time periods - all ending by August 31, 2025
     recent_period_start = target_date - timedelta(days=7)    # Aug 24-31, 2025
@@ -917,170 +790,223 @@ def generate_incidents():
     historical_start = target_date - timedelta(days=540)     # 18 months before Aug 31
     historical_end = target_date - timedelta(days=30)        # 30 days before Aug 31
 
-    # Get diverse component distribution
-    components_by_tier = ensure_diverse_incident_distribution()
-
-    previous_titles_by_component = {}
-
-    for comp in components.values():
-        comp_id = comp['component_id']
-        comp_type = comp['component_type']
-        prod = product_by_id.get(comp['product_id'])
-        prod_status = prod['status'] if prod else 'active'
-        
-        # Get subscription for this component
-        subscription = subscription_by_component.get(comp_id)
-        tier = subscription['sla_tier'] if subscription else 'standard'
+    comp_id = comp['component_id']
+    comp_type = comp['component_type']
+    prod = product_by_id.get(comp['product_id'])
+    prod_status = prod['status'] if prod else 'active'
+
+    # Get subscription for this component
+    subscription = subscription_by_component.get(comp_id)
+    tier = subscription['sla_tier'] if subscription else 'standard'
+
+    # Decide number of incidents - more for premium tier around Aug 31
+    if comp['status'] == 'online' and prod_status == 'active':
+        if tier == 'premium':
+            n_historical = random.randint(3, 5)
+            n_recent = random.randint(3, 6)  # More incidents for premium
+        elif tier == 'standard':
+            n_historical = random.randint(2, 4)
+            n_recent = random.randint(2, 4)
+        else:  # basic
+            n_historical = random.randint(1, 3)
+            n_recent = random.randint(1, 3)
+    else:
+        n_historical = random.randint(1, 2)
+        n_recent = random.randint(0, 1)
+
+    # Generate historical incidents
+    historical_timestamps = []
+    for i in range(n_historical):
+        dt = fake.date_time_between(start_date=historical_start, end_date=historical_end)
+        historical_timestamps.append(dt)
+    historical_timestamps.sort()
+
+    # Generate recent incidents (up to Aug 31, 2025 only)
+    recent_timestamps = []
+    for i in range(n_recent):
+        dt = fake.date_time_between(start_date=recent_period_start, end_date=target_date)
+        recent_timestamps.append(dt)
+    recent_timestamps.sort()
+
+    all_timestamps = historical_timestamps + recent_timestamps
+    n_total = len(all_timestamps)
+
+    # Determine statuses
+    statuses = []
+    for i in range(n_total):
+        if i == n_total - 1:  # Latest incident
+            statuses.append(choose_latest_status(comp['status'], prod_status))
+        elif i >= n_historical:  # Recent incidents
+            # Recent incidents more likely to be open/in_progress
+            statuses.append(random.choices(['open', 'in_progress', 'resolved'], weights=[30, 40, 30])[0])
+        else:  # Historical incidents
+            statuses.append(choose_historical_status(comp['status'], prod_status))
+
+    # Handle special cases
+    if prod_status == 'deprecated' and comp['status'] == 'offline':
+        statuses = ['closed'] * n_total
+    if comp['status'] == 'degraded':
+        statuses = [s if s in ['resolved', 'closed'] else random.choice(['resolved', 'closed']) for s in statuses]
+
+    # Generate incidents
+    prev_titles = []
+    seen_titles = set()
+    records = []
+
+    for idx in range(n_total):
+        status = statuses[idx]
+        detected_at = all_timestamps[idx]
+        created_at = detected_at + timedelta(minutes=random.randint(1, 30))
+
+        # Choose title
+        if prev_titles and random.random() < 0.25:
+            category, title = random.choice(prev_titles)
+            is_recurring = True
+        else:
+            category, title = pick_category_and_title(comp_type)
+            is_recurring = False
 
-        # Decide number of incidents - more for premium tier around Aug 31
-        if comp['status'] == 'online' and prod_status == 'active':
+        # Ensure severity distribution varies by tier and time period
+        if idx >= n_historical:  # Recent incidents
             if tier == 'premium':
-                n_historical = random.randint(3, 5)
-                n_recent = random.randint(3, 6)  # More incidents for premium
+                severity = random.choices(['P1', 'P2', 'P3', 'P4'], weights=[20, 30, 35, 15])[0]
             elif tier == 'standard':
-                n_historical = random.randint(2, 4)
-                n_recent = random.randint(2, 4)
+                severity = random.choices(['P1', 'P2', 'P3', 'P4'], weights=[10, 25, 45, 20])[0]
             else:  # basic
-                n_historical = random.randint(1, 3)
-                n_recent = random.randint(1, 3)
-        else:
-            n_historical = random.randint(1, 2)
-            n_recent = random.randint(0, 1)
-
-        # Generate historical incidents
-        historical_timestamps = []
-        for i in range(n_historical):
-            dt = fake.date_time_between(start_date=historical_start, end_date=historical_end)
-            historical_timestamps.append(dt)
-        historical_timestamps.sort()
-
-        # Generate recent incidents (up to Aug 31, 2025 only)
-        recent_timestamps = []
-        for i in range(n_recent):
-            dt = fake.date_time_between(start_date=recent_period_start, end_date=target_date)
-            recent_timestamps.append(dt)
-        recent_timestamps.sort()
-
-        all_timestamps = historical_timestamps + recent_timestamps
-        n_total = len(all_timestamps)
-
-        # Determine statuses
-        statuses = []
-        for i in range(n_total):
-            if i == n_total - 1:  # Latest incident
-                statuses.append(choose_latest_status(comp['status'], prod_status))
-            elif i >= n_historical:  # Recent incidents
-                # Recent incidents more likely to be open/in_progress
-                statuses.append(random.choices(['open', 'in_progress', 'resolved'], weights=[30, 40, 30])[0])
-            else:  # Historical incidents
-                statuses.append(choose_historical_status(comp['status'], prod_status))
-
-        # Handle special cases
-        if prod_status == 'deprecated' and comp['status'] == 'offline':
-            statuses = ['closed'] * n_total
-        if comp['status'] == 'degraded':
-            statuses = [s if s in ['resolved', 'closed'] else random.choice(['resolved', 'closed']) for s in statuses]
-
-        # Generate incidents
-        prev_titles = previous_titles_by_component.setdefault(comp_id, [])
-
-        for idx in range(n_total):
-            status = statuses[idx]
-            detected_at = all_timestamps[idx]
-            created_at = detected_at + timedelta(minutes=random.randint(1, 30))
-
-            # Choose title
-            if prev_titles and random.random() < 0.25:
-                category, title = random.choice(prev_titles)
-                is_recurring = True
-            else:
-                category, title = pick_category_and_title(comp_type)
-                is_recurring = False
-
-            # Ensure severity distribution varies by tier and time period
-            if idx >= n_historical:  # Recent incidents
-                if tier == 'premium':
-                    severity = random.choices(['P1', 'P2', 'P3', 'P4'], weights=[20, 30, 35, 15])[0]
-                elif tier == 'standard':
-                    severity = random.choices(['P1', 'P2', 'P3', 'P4'], weights=[10, 25, 45, 20])[0]
-                else:  # basic
-                    severity = random.choices(['P1', 'P2', 'P3', 'P4'], weights=[5, 15, 40, 40])[0]
-            else:  # Historical incidents
-                severity = choose_severity()  # Use original distribution
-
-            impact, urgency = severity_to_impact_urgency(severity)
-
-            # Calculate resolution timing based on SLA
-            resolved_at = None
-            closed_at = None
-            sla_breach = False
-            rto_breach = False
-
-            if status in ['resolved', 'closed']:
-                if subscription:
-                    calculated_resolution, is_sla_breach = calculate_sla_compliant_resolution(
-                        detected_at, severity, subscription['subscription_id']
-                    )
-                    if calculated_resolution:
-                        resolved_at = calculated_resolution
-                        sla_breach = is_sla_breach
-                        rto_breach = is_sla_breach and severity in ['P1', 'P2']
-                    else:
-                        # Fallback if no SLA
-                        resolved_at = detected_at + timedelta(hours=random.randint(1, 48))
+                severity = random.choices(['P1', 'P2', 'P3', 'P4'], weights=[5, 15, 40, 40])[0]
+        else:  # Historical incidents
+            severity = choose_severity()  # Use original distribution
+
+        impact, urgency = severity_to_impact_urgency(severity)
+
+        # Calculate resolution timing based on SLA
+        resolved_at = None
+        closed_at = None
+        sla_breach = False
+        rto_breach = False
+
+        if status in ['resolved', 'closed']:
+            if subscription:
+                calculated_resolution, is_sla_breach = calculate_sla_compliant_resolution(
+                    detected_at, severity, subscription['subscription_id']
+                )
+                if calculated_resolution:
+                    resolved_at = calculated_resolution
+                    sla_breach = is_sla_breach
+                    rto_breach = is_sla_breach and severity in ['P1', 'P2']
                 else:
-                    # No subscription - use random timing
+                    # Fallback if no SLA
                     resolved_at = detected_at + timedelta(hours=random.randint(1, 48))
-                
-                if status == 'closed':
-                    closed_at = resolved_at + timedelta(hours=random.randint(1, 24))
-
-            # Manager assignment
-            assigned_manager = None
-            if status != 'open' and managers:
-                assigned_manager = random.choice(managers)
-
-            # Client selection
-            client = client_for_status(status)
-
-            # Reporter
-            reporter = random.choice(reporters) if reporters else random.choice(list(users.values()))
-
-            # Downtime calculation
-            downtime_minutes = 0
-            if severity in ['P1', 'P2'] and resolved_at:
-                downtime_duration = resolved_at - detected_at
-                downtime_minutes = min(int(downtime_duration.total_seconds() / 60), 480)  # Cap at 8 hours
-
-            # Track titles for recurrence
-            if not any(t == title for (_, t) in prev_titles):
-                prev_titles.append((category, title))
-
-            # Build incident record
-            incidents[str(incident_id)] = {
-                'incident_id': str(incident_id),
-                'title': title,
-                'reporter_id': reporter['user_id'],
-                'assigned_manager_id': assigned_manager['user_id'] if assigned_manager else None,
-                'client_id': client['client_id'],
-                'component_id': comp_id,
-                'severity': severity,
-                'status': status,
-                'impact': impact,
-                'urgency': urgency,
-                'category': category,
-                'detected_at': detected_at.isoformat(),
-                'resolved_at': resolved_at.isoformat() if resolved_at else None,
-                'closed_at': closed_at.isoformat() if closed_at else None,
-                'rto_breach': rto_breach,
-                'sla_breach': sla_breach,
-                'is_recurring': is_recurring,
-                'downtime_minutes': downtime_minutes,
-                'created_at': created_at.isoformat(),
-                'updated_at': (closed_at or resolved_at or created_at + timedelta(hours=random.randint(1, 24))).isoformat()
-            }
+            else:
+                # No subscription - use random timing
+                resolved_at = detected_at + timedelta(hours=random.randint(1, 48))
 
-            incident_id += 1
+            if status == 'closed':
+                closed_at = resolved_at + timedelta(hours=random.randint(1, 24))
+
+        # Manager assignment
+        assigned_manager = None
+        if status != 'open' and managers:
+            assigned_manager = random.choice(managers)
+
+        # Client selection
+        client = client_for_status(status)
+
+        # Reporter
+        reporter = random.choice(reporters) if reporters else random.choice(all_users)
+
+        # Downtime calculation
+        downtime_minutes = 0
+        if severity in ['P1', 'P2'] and resolved_at:
+            downtime_duration = resolved_at - detected_at
+            downtime_minutes = min(int(downtime_duration.total_seconds() / 60), 480)  # Cap at 8 hours
+
+        # Track titles for recurrence
+        if title not in seen_titles:
+            seen_titles.add(title)
+            prev_titles.append((category, title))
+
+        # Build incident record (IDs are assigned when components are merged in order)
+        records.append({
+            'incident_id': None,
+            'title': title,
+            'reporter_id': reporter['user_id'],
+            'assigned_manager_id': assigned_manager['user_id'] if assigned_manager else None,
+            'client_id': client['client_id'],
+            'component_id': comp_id,
+            'severity': severity,
+            'status': status,
+            'impact': impact,
+            'urgency': urgency,
+            'category': category,
+            'detected_at': detected_at.isoformat(),
+            'resolved_at': resolved_at.isoformat() if resolved_at else None,
+            'closed_at': closed_at.isoformat() if closed_at else None,
+            'rto_breach': rto_breach,
+            'sla_breach': sla_breach,
+            'is_recurring': is_recurring,
+            'downtime_minutes': downtime_minutes,
+            'created_at': created_at.isoformat(),
+            'updated_at': (closed_at or resolved_at or created_at + timedelta(hours=random.randint(1, 24))).isoformat()
+        })
+
+    return records
+
+def seed_component(base_seed, comp_id):
+    """Random streams for one component's incidents, independent of which process generates them"""
+    random.seed(f"{base_seed}:{comp_id}")
+    fake.seed_instance(f"{base_seed}:{comp_id}")
+
+# Lookups for generate_incident_partition, installed in each pool worker by init_incident_worker
+partition_lookups = None
+
+def init_incident_worker(lookups):
+    global partition_lookups
+    init_worker()
+    partition_lookups = lookups
+
+def generate_incident_partition(components, base_seed):
+    """Incidents for a run of consecutive components (in a pool worker), one list per component"""
+    results = []
+    for comp in components:
+        seed_component(base_seed, comp['component_id'])
+        results.append(generate_component_incidents(comp, partition_lookups))
+    return results
+
+def generate_incidents():
+    """Generate incidents with realistic SLA-aligned timing and many recent incidents around Aug 31, 2025
+
+    Each component's incidents come from their own random streams, derived from
+    the stage's stream, so with stage_workers > 1 the components can be split
+    across processes and merged back in component order with the same result.
+    Incident IDs are assigned at the merge.
+    """
+    components = list(data['infrastructure_components'].values())
+    lookups = incident_lookups()
+
+    base_seed = random.getrandbits(64)
+    if stage_workers > 1 and len(components) > 1:
+        import concurrent.futures
+
+        # A few partitions per worker so uneven components still balance out
+        size = -(-len(components) // (stage_workers * 4))
+        partitions = [components[i:i + size] for i in range(0, len(components), size)]
+        with concurrent.futures.ProcessPoolExecutor(stage_workers, initializer=init_incident_worker,
+                                                    initargs=(lookups,)) as pool:
+            futures = [pool.submit(generate_incident_partition, partition, base_seed) for partition in partitions]
+            per_component = [records for future in progress.track(futures, 'partitions')
+                             for records in future.result()]
+    else:
+        per_component = []
+        for comp in progress.track(components, 'components'):
+            seed_component(base_seed, comp['component_id'])
+            per_component.append(generate_component_incidents(comp, lookups))
+
+    incidents = {}
+    for records in per_component:
+        for record in records:
+            record['incident_id'] = str(len(incidents) + 1)
+            incidents[record['incident_id']] = record
 
     data['incidents'] = incidents
     return incidents
@@ -1098,9 +1024,17 @@ def generate_incident_updates():
         if u['status'] == 'active' and u['role'] in ['incident_manager', 'technical_support', 'executive']
     ]
     managers = [u for u in users.values() if u['status'] == 'active' and u['role'] == 'incident_manager']
+
+    # Group workarounds and communications by incident once instead of scanning them per incident
+    workarounds_by_incident = {}
+    for w in workarounds.values():
+        workarounds_by_incident.setdefault(w['incident_id'], []).append(w)
+    communications_by_incident = {}
+    for c in communications.values():
+        communications_by_incident.setdefault(c['incident_id'], []).append(c)
     
     update_id = 1
-    for incident_id, incident in incidents.items():
+    for incident_id, incident in progress.track(incidents.items(), 'incidents'):
         incident_created = datetime.fromisoformat(incident['created_at'].replace('Z', ''))
         incident_updated = datetime.fromisoformat(incident['updated_at'].replace('Z', ''))
 
@@ -1174,7 +1108,7 @@ def generate_incident_updates():
                 })
 
         # Workaround updates (if exists for this incident)
-        incident_workarounds = [w for w in workarounds.values() if w['incident_id'] == incident_id]
+        incident_workarounds = workarounds_by_incident.get(incident_id, [])
         for w in incident_workarounds:
             incident_updates.append({
                 'update_type': 'workaround',
@@ -1184,7 +1118,7 @@ def generate_incident_updates():
             })
 
         # Communication updates (if exists for this incident)
-        incident_comms = [c for c in communications.values() if c['incident_id'] == incident_id]
+        incident_comms = communications_by_incident.get(incident_id, [])
         for c in incident_comms:
             incident_updates.append({
                 'update_type': 'communication',
@@ -1227,7 +1161,7 @@ def generate_workarounds():
                    u['role'] in ['incident_manager', 'technical_support', 'system_administrator']]
     
     workaround_id = 1
-    for incident_id, incident in critical_incidents.items():
+    for incident_id, incident in progress.track(critical_incidents.items(), 'incidents'):
         if random.choice([True, False]):  # 50% chance of having a workaround
             implementer = random.choice(implementers)
             
@@ -1257,8 +1191,9 @@ def generate_workarounds():
             workaround_id += 1
     
     # Generate additional workarounds to reach at least 100
-    while workaround_id <= 100:
-        incident = random.choice(list(critical_incidents.values()))
+    critical_incident_list = list(critical_incidents.values())
+    while workaround_id <= scaled(100):
+        incident = random.choice(critical_incident_list)
         implementer = random.choice(implementers)
         
         if incident['status'] == 'in_progress':
@@ -1302,7 +1237,7 @@ def generate_root_cause_analysis():
                  u['role'] in ['incident_manager', 'technical_support', 'system_administrator']]
     
     rca_id = 1
-    for incident_id, incident in eligible_incidents.items():
+    for incident_id, incident in progress.track(eligible_incidents.items(), 'incidents'):
         conductor = random.choice(conductors)
         
         # Status should align with incident status
@@ -1347,18 +1282,8 @@ def generate_communications():
     # Users who can receive communications
     recipients = [u for u in users.values() if u['status'] == 'active']
     
-    recipient_type_by_role = {
-        'client_contact': 'client',
-        'incident_manager': 'internal_team',
-        'technical_support': 'internal_team',
-        'account_manager': 'internal_team',
-        'executive': 'executive',
-        'system_administrator': 'internal_team',
-        'vendor_contact': 'vendor'
-    }
-    
     comm_id = 1
-    for incident_id, incident in incidents.items():
+    for incident_id, incident in progress.track(incidents.items(), 'incidents'):
         num_communications = random.randint(1, 3)
         
         for i in range(num_communications):
@@ -1418,20 +1343,21 @@ def generate_escalations():
         ]
     ]
 
-    escalation_level_by_role = {
-        'technical_support': 'technical',
-        'incident_manager': 'management',
-        'account_manager': 'management',
-        'executive': 'executive',
-        'vendor_contact': 'vendor'
-    }
+    escalation_to_position = {u['user_id']: i for i, u in enumerate(escalation_to_users)}
+    incidents_with_workarounds = {w['incident_id'] for w in workarounds.values()}
 
     escalation_id = 1
-    for incident_id, incident in list(eligible_incidents.items()):
+    for incident_id, incident in progress.track(list(eligible_incidents.items()), 'incidents'):
         if random.random() < 0.5:  # ~50% chance of escalation
             escalated_by = random.choice(escalation_by_users)
-            possible_targets = [u for u in escalation_to_users if u['user_id'] != escalated_by['user_id']]
-            escalated_to = random.choice(possible_targets)
+            # Pick uniformly among the targets other than escalated_by without rebuilding the list;
+            # randrange(n) draws exactly like random.choice over an n-element list
+            skip = escalation_to_position.get(escalated_by['user_id'])
+            if skip is None:
+                escalated_to = random.choice(escalation_to_users)
+            else:
+                pick = random.randrange(len(escalation_to_users) - 1)
+                escalated_to = escalation_to_users[pick + (pick >= skip)]
 
             # ---- Reason determination ----
             reasons = []
@@ -1441,7 +1367,7 @@ def generate_escalations():
                 reasons.append('severity_increase')
             if incident['status'] == 'in_progress':
                 # unresolved but workaround exists → resource issue
-                if any(w['incident_id'] == incident_id for w in workarounds.values()):
+                if incident_id in incidents_with_workarounds:
                     reasons.append('resource_unavailable')
             # fallback reasons if none matched
             if not reasons:
@@ -1499,7 +1425,7 @@ def generate_change_requests():
                 u['role'] in ['incident_manager', 'technical_support', 'executive']]
     
     change_id = 1
-    for incident_id, incident in list(eligible_incidents.items())[:120]:  # Limit to 120
+    for incident_id, incident in list(eligible_incidents.items())[:scaled(120)]:  # Limit to 120 at scale 1
         requester = random.choice(requesters)
         approver = random.choice(approvers)
         while approver == requester:
@@ -1515,7 +1441,7 @@ def generate_change_requests():
         actual_end = None
         
         if status in ['scheduled', 'in_progress', 'completed', 'failed', 'rolled_back']:
-            max_date = datetime(2025, 8, 31, 23, 59, 59)
+            max_date = REFERENCE_DATE
             base_time = fake.date_time_between(
                 start_date=datetime.fromisoformat(incident['created_at'].replace('Z', '')),
                 end_date=max_date
@@ -1578,7 +1504,7 @@ def generate_rollback_requests():
         
         executed_at = None
         if status in ['in_progress', 'completed', 'failed']:
-            max_date = datetime(2025, 8, 31, 23, 59, 59)
+            max_date = REFERENCE_DATE
             executed_at = fake.date_time_between(
                 start_date=datetime.fromisoformat(change['created_at'].replace('Z', '')),
                 end_date=max_date
@@ -1608,7 +1534,7 @@ def generate_metrics():
     incidents = data['incidents']
     
     metric_id = 1
-    for incident_id, incident in incidents.items():
+    for incident_id, incident in progress.track(incidents.items(), 'incidents'):
         # Generate 1-2 metrics per incident
         num_metrics = random.randint(1, 2)
         
@@ -1660,13 +1586,13 @@ def generate_incident_reports():
                  u['role'] in ['incident_manager', 'account_manager', 'executive']]
     
     report_id = 1
-    for incident_id, incident in incidents.items():
+    for incident_id, incident in progress.track(incidents.items(), 'incidents'):
         generator = random.choice(generators)
         report_type = random.choice(['executive_summary', 'technical_details', 'business_impact', 
                                     'compliance_report', 'post_mortem'])
         status = random.choice(['draft', 'completed', 'distributed'])
         
-        max_date = datetime(2025, 8, 31, 23, 59, 59)
+        max_date = REFERENCE_DATE
         generated_at = fake.date_time_between(
             start_date=datetime.fromisoformat(incident['created_at'].replace('Z', '')),
             end_date=max_date
@@ -1693,32 +1619,6 @@ def generate_knowledge_base_articles():
     incidents = data['incidents']
     users = data['users']
     
-    # Incident category -> KB baseline category
-    incident_category_map = {
-        'client_onboarding': 'client_onboarding',
-        'client_support': 'incident_response',
-        'client_escalation': 'sla_management',
-        'data_update': 'data_synchronization',
-        'system_outage': 'system_outages',
-        'security_breach': 'security_incidents',
-        'performance_issue': 'performance_degradation',
-        'integration_failure': 'third_party_integrations',
-        'vendor_issue': 'vendor_escalations'
-    }
-
-    # Component type -> More specific KB category
-    component_category_map = {
-        'sftp_server': 'file_transfer_problems',
-        'api_endpoint': 'api_integration',
-        'database': 'database_issues',
-        'load_balancer': 'network_connectivity',
-        'firewall': 'network_connectivity',
-        'authentication_service': 'authentication_issues',
-        'payment_gateway': 'payment_processing',
-        'file_storage': 'backup_recovery',
-        'monitoring_system': 'monitoring_alerts'
-    }
-
     def determine_kb_category(incident, components):
         """
         Pick KB category based on incident category + component type.
@@ -1747,17 +1647,10 @@ def generate_knowledge_base_articles():
     reviewers = [u for u in users.values() if u['status'] == 'active' and 
                 u['role'] in ['incident_manager', 'technical_support', 'executive']]
     
-    categories = [
-        'authentication_issues', 'payment_processing', 'api_integration',
-        'data_synchronization', 'system_outages', 'performance_degradation',
-        'security_incidents', 'backup_recovery', 'user_management',
-        'billing_issues', 'compliance_procedures', 'vendor_escalations'
-    ]
-    
     article_id = 1
     
     # Generate articles based on incidents
-    for incident_id, incident in list(incidents.items())[:150]:  # Limit to 150
+    for incident_id, incident in list(incidents.items())[:scaled(150)]:  # Limit to 150 at scale 1
         if random.choice([True, False]):  # 50% chance
             creator = random.choice(creators)
             reviewer = random.choice(reviewers) if random.choice([True, False]) else None
@@ -1784,12 +1677,12 @@ def generate_knowledge_base_articles():
             article_id += 1
     
     # Generate additional standalone articles
-    while article_id <= 100:
+    while article_id <= scaled(100):
         creator = random.choice(creators)
         reviewer = random.choice(reviewers) if random.choice([True, False]) else None
         
         article_type = random.choice(['troubleshooting', 'resolution_steps', 'prevention_guide', 'faq'])
-        category = random.choice(categories)
+        category = random.choice(kb_categories)
         status = random.choice(['draft', 'published', 'archived'])
         
         created_at, updated_at = generate_timestamps()
@@ -1826,7 +1719,7 @@ def generate_post_incident_reviews():
                    u['role'] in ['incident_manager', 'executive']]
     
     pir_id = 1
-    for incident_id, incident in eligible_incidents.items():
+    for incident_id, incident in progress.track(eligible_incidents.items(), 'incidents'):
         facilitator = random.choice(facilitators)
         
         # Schedule PIR after incident closure
@@ -1853,77 +1746,192 @@ def generate_post_incident_reviews():
     data['post_incident_reviews'] = pir_data
     return pir_data
 
-def save_all_data():
-    """Save all generated data to JSON files"""
-    # Generate all data in order (respecting dependencies)
-    print("Generating clients...")
-    generate_clients()
-    
-    print("Generating vendors...")
-    generate_vendors()
-    
-    print("Generating users...")
-    generate_users()
-    
-    print("Generating products...")
-    generate_products()
-    
-    print("Generating infrastructure components...")
-    generate_infrastructure_components()
-    
-    print("Generating client subscriptions...")
-    generate_client_subscriptions()
-    
-    print("Generating SLA agreements...")
-    generate_sla_agreements()
-    
-    print("Generating incidents...")
-    generate_incidents()
-    
-    print("Generating workarounds...")
-    generate_workarounds()
-    
-    print("Generating root cause analysis...")
-    generate_root_cause_analysis()
-    
-    print("Generating communications...")
-    generate_communications()
-
-    print("Generating incident updates...")
-    generate_incident_updates()
-    
-    print("Generating escalations...")
-    generate_escalations()
-    
-    print("Generating change requests...")
-    generate_change_requests()
-    
-    print("Generating rollback requests...")
-    generate_rollback_requests()
-    
-    print("Generating metrics...")
-    generate_metrics()
-    
-    print("Generating incident reports...")
-    generate_incident_reports()
-    
-    print("Generating knowledge base articles...")
-    generate_knowledge_base_articles()
-    
-    print("Generating post incident reviews...")
-    generate_post_incident_reviews()
-    
-    # Save to individual JSON files
-    for table_name, table_data in data.items():
-        filename = f"incident_management_data/{table_name}.json"
+# Generation stages in dependency order: (table name, generator, label)
+STAGES = [
+    ('clients', generate_clients, 'clients'),
+    ('vendors', generate_vendors, 'vendors'),
+    ('users', generate_users, 'users'),
+    ('products', generate_products, 'products'),
+    ('infrastructure_components', generate_infrastructure_components, 'infrastructure components'),
+    ('client_subscriptions', generate_client_subscriptions, 'client subscriptions'),
+    ('sla_agreements', generate_sla_agreements, 'SLA agreements'),
+    ('incidents', generate_incidents, 'incidents'),
+    ('workarounds', generate_workarounds, 'workarounds'),
+    ('root_cause_analysis', generate_root_cause_analysis, 'root cause analysis'),
+    ('communications', generate_communications, 'communications'),
+    ('incident_updates', generate_incident_updates, 'incident updates'),
+    ('escalations', generate_escalations, 'escalations'),
+    ('change_requests', generate_change_requests, 'change requests'),
+    ('rollback_requests', generate_rollback_requests, 'rollback requests'),
+    ('metrics', generate_metrics, 'metrics'),
+    ('incident_reports', generate_incident_reports, 'incident reports'),
+    ('knowledge_base_articles', generate_knowledge_base_articles, 'knowledge base articles'),
+    ('post_incident_reviews', generate_post_incident_reviews, 'post incident reviews'),
+]
+
+def generate_incident_view():
+    """Denormalised incidents joined to their client, component, product, vendor and SLA"""
+    data['incident_view'] = incident_view.build_view(data)
+    return data['incident_view']
+
+# Derived tables written alongside the generated ones when asked for (--views)
+EXPORT_STAGES = [
+    ('incident_view', generate_incident_view, 'incident view'),
+]
+
+# Tables each stage reads from `data` (every stage writes only its own table)
+STAGE_READS = {
+    'clients': [],
+    'vendors': [],
+    'users': ['clients', 'vendors'],
+    'products': ['vendors'],
+    'infrastructure_components': ['products'],
+    'client_subscriptions': ['clients', 'products'],
+    'sla_agreements': ['client_subscriptions'],
+    'incidents': ['clients', 'users', 'products', 'infrastructure_components', 'client_subscriptions',
+                  'sla_agreements'],
+    'workarounds': ['incidents', 'users'],
+    'root_cause_analysis': ['incidents', 'users'],
+    'communications': ['incidents', 'users'],
+    'incident_updates': ['incidents', 'users', 'workarounds', 'communications'],
+    'escalations': ['incidents', 'users', 'workarounds'],
+    'change_requests': ['incidents', 'users'],
+    'rollback_requests': ['change_requests', 'incidents', 'users'],
+    'metrics': ['incidents'],
+    'incident_reports': ['incidents', 'users'],
+    'knowledge_base_articles': ['incidents', 'infrastructure_components', 'users'],
+    'post_incident_reviews': ['incidents', 'users'],
+    'incident_view': incident_view.READS,
+}
+
+# Code and constants shared between stages; part of every stage's cache key
+SHARED_CODE = [generate_phone, generate_email, generate_timestamps, slugify, scaled, catalogs, REFERENCE_DATE]
+
+# Module-level helpers a stage calls besides its generate_* function; part of that stage's cache key
+STAGE_HELPERS = {
+    'incidents': [incident_lookups, generate_component_incidents,
+                  seed_component, generate_incident_partition],
+    'incident_view': [incident_view],
+}
+
+def required_tables(targets):
+    """The target tables plus every table they transitively read"""
+    unknown = set(targets) - set(STAGE_READS)
+    if unknown:
+        raise ValueError(f"unknown tables: {', '.join(sorted(unknown))}")
+    required = set()
+    stack = list(targets)
+    while stack:
+        table_name = stack.pop()
+        if table_name not in required:
+            required.add(table_name)
+            stack.extend(STAGE_READS[table_name])
+    return required
+
+def seed_stage(seed, table_name):
+    """Give each stage its own random streams, derived from the run seed and the table name
+
+    A stage's output then depends only on the seed and its input tables, not on
+    how much randomness earlier stages consumed.
+    """
+    random.seed(f"{seed}:{table_name}")
+    fake.seed_instance(f"{seed}:{table_name}")
+
+def init_worker():
+    """Process-pool initializer: workers report no progress and draw from their own random streams"""
+    progress.state['active'] = False
+    random.seed()
+    fake.seed_instance()
+
+def run_stage_worker(table_name, inputs, scale, seed, instrumented=False, cprofile_dir=None, workers=1):
+    """Generate one table in a pool worker from the tables it reads; returns (table, stage stats)"""
+    global scale_factor, stage_workers
+    scale_factor = scale
+    stage_workers = workers
+    data.clear()
+    data.update(inputs)
+    if seed is not None:
+        seed_stage(seed, table_name)
+    generate = {name: function for name, function, _ in STAGES + EXPORT_STAGES}[table_name]
+    stats = None
+    if instrumented:
+        # Build Faker outside the stage's timing
+        fake.build()
+        stats = instrumentation.run_stage({'stages': {}}, table_name, generate, data, cprofile_dir)
+    else:
+        generate()
+    return data[table_name], stats
+
+def write_table(table_name, table_data, output_dir='incident_management_data', indent=2, output_format='json'):
+    """Write one table to its JSON file (or compact JSON file, see compact_json) and return the filename"""
+    if output_format == 'compact':
+        filename = compact_json.table_path(table_name, output_dir)
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(table_data, f, indent=2, ensure_ascii=False)
-        print(f"Generated {filename} with {len(table_data)} records")
-    
-    print("\nData generation complete!")
-    print(f"Total tables generated: {len(data)}")
-    for table_name, table_data in data.items():
-        print(f"  {table_name}: {len(table_data)} records")
+            compact_json.dump(table_data, f)
+        return filename
+    filename = f"{output_dir}/{table_name}.json"
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(table_data, f, indent=indent, ensure_ascii=False)
+    return filename
+
+def rng_state():
+    """State of both random generators the stages draw from"""
+    return random.getstate(), fake.random.getstate()
+
+def set_rng_state(state):
+    random_state, faker_state = state
+    random.setstate(random_state)
+    fake.random.setstate(faker_state)
+
+def save_all_data(scale=1, output_dir='incident_management_data', **options):
+    """Generate the tables and save them to JSON files; see scheduler.RunOptions for the options"""
+    global scale_factor, stage_workers
+    options = scheduler.RunOptions(scale=scale, output_dir=output_dir, **options)
+    scale_factor = scale
+    stage_workers = options.workers
+    data.clear()
+    stages = STAGES + EXPORT_STAGES if options.views else STAGES
+    if options.tables is not None:
+        stages = [stage for stage in STAGES + EXPORT_STAGES if stage[0] in required_tables(options.tables)]
+    return scheduler.GenerationRun(sys.modules[__name__], stages, options).run()
 
 if __name__ == "__main__":
-    save_all_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate the incident management dataset")
+    parser.add_argument('--scale', type=float, default=1, help="scale factor for entity counts (default 1)")
+    parser.add_argument('--output-dir', default='incident_management_data')
+    parser.add_argument('--profile', metavar='REPORT_JSON', help="write a per-stage timing/memory report")
+    parser.add_argument('--cprofile-dir', help="dump a cProfile file per stage into this directory")
+    parser.add_argument('--progress', dest='show_progress', action='store_true', default=None,
+                        help="show live progress even when stderr is not a terminal "
+                             "(with --workers > 1, stages only report when they finish)")
+    parser.add_argument('--metrics-file', help="keep Prometheus-format progress metrics in this file")
+    parser.add_argument('--metrics-port', type=int, help="serve Prometheus-format progress metrics on this port")
+    parser.add_argument('--seed', type=int, help="seed the random generators for a reproducible run")
+    parser.add_argument('--checkpoint-dir', help="checkpoint each stage here and resume from it if present")
+    parser.add_argument('--cache-dir', help="reuse tables whose seed, parameters, code and inputs are unchanged")
+    parser.add_argument('--workers', type=int, default=1, help="run independent stages in this many processes")
+    parser.add_argument('--tables', nargs='+', metavar='TABLE',
+                        help="generate only these tables and the tables they depend on")
+    parser.add_argument('--release-memory', action='store_true',
+                        help="write each table when done and free it once no later stage reads it")
+    parser.add_argument('--memory-budget-mb', type=float,
+                        help="also spill live tables to disk to keep generated data under this size")
+    parser.add_argument('--compact-sla', action='store_true',
+                        help="write SLA agreements as per-tier templates plus one entry per subscription")
+    parser.add_argument('--output-format', choices=['json', 'compact'], default='json',
+                        help="compact writes column names and status dictionaries once per table")
+    parser.add_argument('--merkle', dest='merkle_trees', action='store_true',
+                        help="store a Merkle tree beside each table for dataset_diff.py")
+    parser.add_argument('--views', action='store_true',
+                        help="also write derived tables for dashboards (the denormalised incident view)")
+    parser.add_argument('--cache-max-mb', type=float, default=scheduler.RunOptions.cache_max_bytes / 2 ** 20,
+                        help="trim the cache to this size, least recently used first")
+    args = parser.parse_args()
+    save_all_data(scale=args.scale, output_dir=args.output_dir, profile=args.profile, cprofile_dir=args.cprofile_dir,
+                  show_progress=args.show_progress, metrics_file=args.metrics_file, metrics_port=args.metrics_port,
+                  seed=args.seed, checkpoint_dir=args.checkpoint_dir,
+                  cache_dir=args.cache_dir, cache_max_bytes=int(args.cache_max_mb * 2 ** 20), workers=args.workers,
+                  tables=args.tables, release_memory=args.release_memory, compact_sla=args.compact_sla,
+                  output_format=args.output_format, merkle_trees=args.merkle_trees,
+                  views=args.views,
+                  memory_budget=int(args.memory_budget_mb * 2 ** 20) if args.memory_budget_mb is not None else None)
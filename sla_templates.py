@@ -0,0 +1,91 @@
+"""Compact storage for sla_agreements.
+
+Every subscription gets one SLA row per severity whose targets come straight
+from its tier (catalogs.sla_response_times, sla_resolution_times and
+sla_availability_percentages), so sla_agreements.json is almost entirely
+repeated values. The compact form stores each tier's targets once and one
+short entry per subscription:
+
+    {
+      "severities": ["P1", "P2", "P3", "P4"],
+      "templates": {"premium": {"P1": {"response_time_minutes": 15, ...}, ...}, ...},
+      "subscriptions": {"<subscription_id>": [tier, first_sla_id, created_at], ...}
+    }
+
+A subscription's rows have consecutive sla_ids starting at first_sla_id, one
+per severity in order. created_at is a single timestamp when all of its rows
+share it, or a list with one per severity (the generator dates each row
+separately).
+
+expand() turns the compact form back into the exact {sla_id: row} table.
+
+This only changes how the table is stored on disk: generation still builds
+the full {sla_id: row} table in memory, because incident generation and
+sla_compliance look rows up by subscription and severity, and
+dataset.load_table expands the file back into that same shape.
+"""
+from catalogs import sla_availability_percentages, sla_resolution_times, sla_response_times
+
+SEVERITIES = ['P1', 'P2', 'P3', 'P4']
+TARGET_COLUMNS = ('response_time_minutes', 'resolution_time_hours', 'availability_percentage')
+
+def tier_templates():
+    """{tier: {severity: targets}} from the tier catalogues"""
+    return {
+        tier: {
+            severity: {
+                'response_time_minutes': sla_response_times[tier][severity],
+                'resolution_time_hours': sla_resolution_times[tier][severity],
+                'availability_percentage': sla_availability_percentages[tier],
+            }
+            for severity in SEVERITIES
+        }
+        for tier in sla_response_times
+    }
+
+def compact(sla_agreements, templates=None):
+    """The compact form of an sla_agreements table.
+
+    Raises ValueError for a subscription whose rows are not one per severity
+    with consecutive ids and the targets of a single tier, since the compact
+    form cannot represent them.
+    """
+    templates = templates or tier_templates()
+    rows_by_subscription = {}
+    for row in sla_agreements.values():
+        rows_by_subscription.setdefault(row['subscription_id'], []).append(row)
+
+    subscriptions = {}
+    for subscription_id, rows in rows_by_subscription.items():
+        first_sla_id = int(rows[0]['sla_id'])
+        if ([row['severity_level'] for row in rows] != SEVERITIES
+                or [int(row['sla_id']) for row in rows] != list(range(first_sla_id, first_sla_id + len(rows)))):
+            raise ValueError(f"SLA rows of subscription {subscription_id} are not one per severity in id order")
+        targets = [{column: row[column] for column in TARGET_COLUMNS} for row in rows]
+        tier = next((tier for tier, by_severity in templates.items()
+                     if targets == [by_severity[severity] for severity in SEVERITIES]), None)
+        if tier is None:
+            raise ValueError(f"SLA targets of subscription {subscription_id} match no tier template")
+        created_at = [row['created_at'] for row in rows]
+        if len(set(created_at)) == 1:
+            created_at = created_at[0]
+        subscriptions[subscription_id] = [tier, first_sla_id, created_at]
+
+    return {'severities': SEVERITIES, 'templates': templates, 'subscriptions': subscriptions}
+
+def expand(compact_slas):
+    """The {sla_id: row} table a compact form stands for"""
+    severities = compact_slas['severities']
+    templates = compact_slas['templates']
+    sla_agreements = {}
+    for subscription_id, (tier, first_sla_id, created_at) in compact_slas['subscriptions'].items():
+        for offset, severity in enumerate(severities):
+            sla_id = str(first_sla_id + offset)
+            sla_agreements[sla_id] = {
+                'sla_id': sla_id,
+                'subscription_id': subscription_id,
+                'severity_level': severity,
+                **templates[tier][severity],
+                'created_at': created_at if isinstance(created_at, str) else created_at[offset],
+            }
+    return sla_agreements
@@ -0,0 +1,246 @@
+"""As-of snapshots of a generated dataset.
+
+The generator writes one timeline ending at its Aug 31, 2025 cap. Instead of
+regenerating with a different cap for every cutoff, snapshot() derives the
+dataset as it stood at an earlier moment T from that one timeline:
+
+  * event rows (incidents, updates, communications, escalations, metrics,
+    reports, ...) created after T are dropped, as is any row whose incident,
+    change request, workaround or communication no longer exists at T
+  * post-incident reviews and resolution-steps KB articles, which the
+    generator only writes for resolved incidents, are dropped while their
+    incident is not resolved at T
+  * lifecycle timestamps after T (resolved_at, closed_at, acknowledged_at,
+    completed_at, actual_start/end, executed_at) are cleared and the row's
+    status is derived from the ones that remain; an incident that was not
+    resolved yet also loses its breach flags and downtime, as it had none
+    when still open
+  * incident fields with a change history in incident_updates (severity,
+    assigned manager) are rolled back to the value they had at T, and
+    impact and urgency follow the rolled-back severity
+  * reference tables (clients, vendors, users, products, components,
+    subscriptions, SLAs) are kept whole, so every foreign key still resolves
+
+Timestamps are compared as ISO strings, which order like the times they
+encode, so no dates are parsed and each snapshot is a single pass per table.
+
+    python snapshots.py 2025-06-30 2025-07-31 [--data-dir DIR] [--output-root snapshots]
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+from catalogs import impact_urgency_by_severity
+from dataset import DATA_DIR, PRIMARY_KEYS, TABLES, end_of, load_data
+from validate_integrity import CONDITIONAL_FOREIGN_KEYS, FOREIGN_KEYS
+
+REFERENCE_TABLES = ['clients', 'vendors', 'users', 'products', 'infrastructure_components',
+                    'client_subscriptions', 'sla_agreements']
+
+# Column that dates each event row; rows after the cutoff did not exist yet
+CREATED_COLUMNS = {
+    'incidents': 'created_at',
+    'workarounds': 'implemented_at',
+    'root_cause_analysis': 'created_at',
+    'communications': 'sent_at',
+    'incident_updates': 'created_at',
+    'escalations': 'escalated_at',
+    'change_requests': 'created_at',
+    'rollback_requests': 'created_at',
+    'metrics': 'recorded_at',
+    'incident_reports': 'generated_at',
+    'knowledge_base_articles': 'created_at',
+    'post_incident_reviews': 'created_at',
+}
+
+# Incident fields whose changes are logged in incident_updates
+HISTORY_FIELDS = ('status', 'severity', 'assigned_manager_id')
+
+def after(value, cutoff):
+    return value is not None and value > cutoff
+
+def later_changes(updates, cutoff):
+    """{(incident_id, field): first update after the cutoff}; its old_value is the value at the cutoff"""
+    first = {}
+    for update in updates.values():
+        if update['field_name'] in HISTORY_FIELDS and after(update['created_at'], cutoff):
+            key = (update['incident_id'], update['field_name'])
+            if key not in first or update['created_at'] < first[key]['created_at']:
+                first[key] = update
+    return first
+
+def last_activity(data, cutoff):
+    """{incident_id: latest child-row timestamp at or before the cutoff}"""
+    latest = {}
+    for table_name, column in list(CREATED_COLUMNS.items()) + [('root_cause_analysis', 'completed_at')]:
+        if table_name == 'incidents' or table_name not in data:
+            continue
+        for row in data[table_name].values():
+            value = row[column]
+            incident_id = row.get('incident_id')
+            if value is not None and not after(value, cutoff) and value > latest.get(incident_id, ''):
+                latest[incident_id] = value
+    return latest
+
+def incident_as_of(incident, cutoff, changes, activity):
+    incident = dict(incident)
+    incident_id = incident['incident_id']
+    for field in ('severity', 'assigned_manager_id'):
+        change = changes.get((incident_id, field))
+        if change is not None and change['old_value'] is not None:
+            incident[field] = change['old_value']
+    # The generator derives impact and urgency from severity
+    incident['impact'], incident['urgency'] = impact_urgency_by_severity[incident['severity']]
+
+    if after(incident['closed_at'], cutoff):
+        incident['closed_at'] = None
+    if after(incident['resolved_at'], cutoff):
+        # Breaches and downtime are only known once the incident is resolved
+        incident.update(resolved_at=None, sla_breach=False, rto_breach=False, downtime_minutes=0)
+    if incident['closed_at'] is not None:
+        incident['status'] = 'closed'
+    elif incident['resolved_at'] is not None:
+        incident['status'] = 'resolved'
+    else:
+        change = changes.get((incident_id, 'status'))
+        status = change['old_value'] if change is not None else incident['status']
+        incident['status'] = status if status in ('open', 'in_progress') else 'in_progress'
+
+    if after(incident['updated_at'], cutoff):
+        known = [incident['created_at'], incident['resolved_at'], incident['closed_at'], activity.get(incident_id)]
+        incident['updated_at'] = max(value for value in known if value is not None)
+    return incident
+
+def escalation_as_of(escalation, cutoff):
+    escalation = dict(escalation)
+    for column in ('acknowledged_at', 'resolved_at'):
+        if after(escalation[column], cutoff):
+            escalation[column] = None
+    if escalation['resolved_at'] is not None:
+        escalation['status'] = 'resolved'
+    elif escalation['acknowledged_at'] is not None:
+        escalation['status'] = 'acknowledged'
+    else:
+        escalation['status'] = 'open'
+    return escalation
+
+def rca_as_of(rca, cutoff):
+    if not after(rca['completed_at'], cutoff):
+        return rca
+    return dict(rca, completed_at=None, status='in_progress')
+
+def change_as_of(change, cutoff):
+    if not (after(change['actual_start'], cutoff) or after(change['actual_end'], cutoff)):
+        return change
+    change = dict(change, actual_end=None)
+    if after(change['actual_start'], cutoff):
+        change.update(actual_start=None, status='scheduled')
+    else:
+        change['status'] = 'in_progress'
+    if after(change['updated_at'], cutoff):
+        change['updated_at'] = change['actual_start'] or change['created_at']
+    return change
+
+def rollback_as_of(rollback, cutoff):
+    if not after(rollback['executed_at'], cutoff):
+        return rollback
+    return dict(rollback, executed_at=None, validation_completed=False, status='approved')
+
+def review_as_of(review, cutoff):
+    if review['status'] != 'completed' or not after(review['scheduled_date'], cutoff):
+        return review
+    return dict(review, status='scheduled', timeline_accuracy_rating=None,
+                communication_effectiveness_rating=None, technical_response_rating=None)
+
+def article_as_of(article, cutoff):
+    if not after(article['updated_at'], cutoff):
+        return article
+    return dict(article, updated_at=article['created_at'])
+
+def awaits_resolution(table_name, row, incidents):
+    """True for a row the generator only writes for resolved incidents whose incident is not resolved yet"""
+    if table_name == 'knowledge_base_articles':
+        if row['article_type'] != 'resolution_steps' or row['incident_id'] is None:
+            return False
+    elif table_name != 'post_incident_reviews':
+        return False
+    return incidents[row['incident_id']]['status'] not in ('resolved', 'closed')
+
+ROW_AS_OF = {
+    'escalations': escalation_as_of,
+    'root_cause_analysis': rca_as_of,
+    'change_requests': change_as_of,
+    'rollback_requests': rollback_as_of,
+    'post_incident_reviews': review_as_of,
+    'knowledge_base_articles': article_as_of,
+}
+
+def dangling(row, references, snapshot):
+    """True if any reference into a filtered table points at a row missing from the snapshot"""
+    for column, ref_table, condition in references:
+        if condition is not None and row[condition[0]] != condition[1]:
+            continue
+        value = row[column]
+        if value is not None and value not in snapshot[ref_table]:
+            return True
+    return False
+
+def snapshot(data, as_of):
+    """The tables in data as they stood at as_of (a datetime or ISO string; a bare date means the end of that day)"""
+    cutoff = as_of.isoformat() if isinstance(as_of, datetime) else end_of(as_of)
+    result = {table_name: data[table_name] for table_name in REFERENCE_TABLES if table_name in data}
+
+    # References into event tables; only those can start dangling when rows are dropped
+    references = {}
+    for table_name, column, ref_table, ref_column, *condition in FOREIGN_KEYS + CONDITIONAL_FOREIGN_KEYS:
+        if isinstance(column, str) and ref_table in CREATED_COLUMNS and PRIMARY_KEYS[ref_table] == ref_column:
+            references.setdefault(table_name, []).append((column, ref_table, condition[0] if condition else None))
+
+    changes = later_changes(data.get('incident_updates', {}), cutoff)
+    activity = last_activity(data, cutoff)
+
+    # Generation order puts every referenced table before the tables that refer to it
+    for table_name in TABLES:
+        if table_name not in CREATED_COLUMNS or table_name not in data:
+            continue
+        created = CREATED_COLUMNS[table_name]
+        as_of_row = ROW_AS_OF.get(table_name)
+        table_references = [ref for ref in references.get(table_name, []) if ref[1] in result]
+        rows = {}
+        for row_id, row in data[table_name].items():
+            if (after(row[created], cutoff) or dangling(row, table_references, result)
+                    or awaits_resolution(table_name, row, result.get('incidents'))):
+                continue
+            if table_name == 'incidents':
+                row = incident_as_of(row, cutoff, changes, activity)
+            elif as_of_row is not None:
+                row = as_of_row(row, cutoff)
+            rows[row_id] = row
+        result[table_name] = rows
+    return result
+
+def snapshots(data, as_of_dates):
+    """{as_of: snapshot} for several cutoffs from the same timeline"""
+    return {as_of: snapshot(data, as_of) for as_of in as_of_dates}
+
+if __name__ == "__main__":
+    from seeded2 import write_table
+
+    parser = argparse.ArgumentParser(description="Write as-of snapshots of a generated dataset")
+    parser.add_argument('as_of', nargs='+', help="ISO dates or datetimes; a bare date means the end of that day")
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--output-root', default='snapshots', help="each snapshot goes to <output-root>/<as_of>/")
+    args = parser.parse_args()
+
+    data = load_data(data_dir=args.data_dir)
+    for as_of in args.as_of:
+        start = time.perf_counter()
+        tables = snapshot(data, as_of)
+        output_dir = os.path.join(args.output_root, as_of.replace(':', ''))
+        os.makedirs(output_dir, exist_ok=True)
+        for table_name, rows in tables.items():
+            write_table(table_name, rows, output_dir)
+        print(f"{as_of}: {len(tables['incidents'])} incidents, "
+              f"{sum(len(rows) for rows in tables.values())} rows -> {output_dir} "
+              f"({time.perf_counter() - start:.2f}s)")
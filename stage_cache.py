@@ -0,0 +1,83 @@
+"""Content-addressed cache of generated tables.
+
+Each stage's table is stored under a key hashed from everything that can
+change it: the seed, the run parameters, the stage's code version (source of
+the generator and the helpers it shares with other stages, plus the Faker
+version) and the keys of the tables it reads. Editing one generator therefore
+changes its key and the keys of everything downstream of it, while upstream
+stages keep their keys and are loaded from the cache instead of regenerated.
+
+Entries are pickles named <key>.pkl. Reading an entry refreshes its mtime, and
+evict() deletes the least recently used entries until the cache fits its size
+budget.
+"""
+import hashlib
+import inspect
+import json
+import os
+import pickle
+
+from checkpoint import atomic_write
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+def source_hash(*objects):
+    """Hash the source code of functions and modules (and the repr of plain values)"""
+    digest = hashlib.sha256()
+    for obj in objects:
+        text = inspect.getsource(obj) if callable(obj) or inspect.ismodule(obj) else repr(obj)
+        digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+def stage_key(seed, parameters, table_name, code_version, upstream_keys):
+    """Cache key of one stage's output"""
+    import importlib.metadata  # slow to import; only needed when caching
+
+    payload = json.dumps({
+        'seed': seed,
+        'parameters': parameters,
+        'table': table_name,
+        'code': code_version,
+        'faker': importlib.metadata.version('faker'),
+        'upstream': upstream_keys,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def entry_path(cache_dir, key):
+    return os.path.join(cache_dir, f"{key}.pkl")
+
+def load(cache_dir, key):
+    """The cached table for key, or None on a miss"""
+    path = entry_path(cache_dir, key)
+    try:
+        with open(path, 'rb') as f:
+            table = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    os.utime(path)
+    return table
+
+def store(cache_dir, key, table):
+    os.makedirs(cache_dir, exist_ok=True)
+    atomic_write(entry_path(cache_dir, key), pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL))
+
+def evict(cache_dir, max_bytes=DEFAULT_MAX_BYTES, keep=()):
+    """Delete least recently used entries (other than those in keep) until the cache fits in max_bytes"""
+    if not os.path.isdir(cache_dir):
+        return []
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.pkl'):
+            stat = os.stat(os.path.join(cache_dir, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        if name[:-len('.pkl')] in keep:
+            continue
+        os.remove(os.path.join(cache_dir, name))
+        total -= size
+        removed.append(name)
+    return removed
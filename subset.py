@@ -0,0 +1,133 @@
+"""Referentially closed subsets of a generated dataset.
+
+A subset starts from seed rows (clients, incidents, or incidents detected
+in a time window) and is closed in two passes over the tables:
+
+  * downward, in generation order, every row owned by a selected row is
+    added: a client's users, subscriptions and incidents, a subscription's
+    SLAs, an incident's workarounds, updates, communications, RCAs, ...,
+    a change request's rollbacks (OWNERSHIP_EDGES)
+  * upward, in reverse generation order, every row a selected row refers to
+    (FOREIGN_KEYS and CONDITIONAL_FOREIGN_KEYS) is added, so every foreign
+    key in the subset resolves; rows added this way bring only themselves,
+    not everything they own
+
+Foreign keys always point at tables earlier in generation order, so each
+pass visits every table once. Children are found through postings built
+with incident_query.build_indexes and seed windows through a time index;
+once those are built (SubsetIndex), extracting a subset costs time
+proportional to its size, not to the dataset's.
+
+    python subset.py --clients 3 17 --output-dir subset
+    python subset.py --detected-from 2025-08-24 --detected-to 2025-08-31 --output-dir last_week
+"""
+import argparse
+import os
+import time
+
+from dataset import DATA_DIR, TABLES, load_data
+from incident_query import build_indexes, build_time_index, sorted_ids, window
+from validate_integrity import CONDITIONAL_FOREIGN_KEYS, FOREIGN_KEYS
+
+# (parent table, child table, child column): children belong to their parent
+OWNERSHIP_EDGES = [
+    ('clients', 'users', 'client_id'),
+    ('clients', 'client_subscriptions', 'client_id'),
+    ('clients', 'incidents', 'client_id'),
+    ('client_subscriptions', 'sla_agreements', 'subscription_id'),
+    ('incidents', 'workarounds', 'incident_id'),
+    ('incidents', 'root_cause_analysis', 'incident_id'),
+    ('incidents', 'communications', 'incident_id'),
+    ('incidents', 'incident_updates', 'incident_id'),
+    ('incidents', 'escalations', 'incident_id'),
+    ('incidents', 'change_requests', 'incident_id'),
+    ('incidents', 'rollback_requests', 'incident_id'),
+    ('incidents', 'metrics', 'incident_id'),
+    ('incidents', 'incident_reports', 'incident_id'),
+    ('incidents', 'knowledge_base_articles', 'incident_id'),
+    ('incidents', 'post_incident_reviews', 'incident_id'),
+    ('change_requests', 'rollback_requests', 'change_id'),
+]
+
+class SubsetIndex:
+    """Child postings and the incident time index, built once per dataset"""
+
+    def __init__(self, data):
+        self.data = data
+        self.children = {}
+        for parent_table, child_table, column in OWNERSHIP_EDGES:
+            postings = build_indexes(data[child_table], columns=(column,))[column]
+            self.children.setdefault(parent_table, []).append((child_table, postings))
+        self.detected = build_time_index(data['incidents'], 'detected_at')
+
+        # Single-column references per table, with the condition (column, value) they apply under
+        self.references = {}
+        for table_name, column, ref_table, _, *condition in FOREIGN_KEYS + CONDITIONAL_FOREIGN_KEYS:
+            if isinstance(column, str):
+                self.references.setdefault(table_name, []).append((column, ref_table, condition[0] if condition else None))
+
+def extract(index, client_ids=(), incident_ids=(), detected_from=None, detected_to=None):
+    """{table: {id: row}} closed subset grown from the given seeds
+
+    A bare date as detected_to includes that whole day, as in snapshots.py.
+    """
+    data = index.data
+    selected = {table_name: set() for table_name in TABLES}
+    selected['clients'].update(client_ids)
+    selected['incidents'].update(incident_ids)
+    if detected_from is not None or detected_to is not None:
+        selected['incidents'].update(window(index.detected, detected_from, detected_to))
+    for table_name, ids in selected.items():
+        missing = [row_id for row_id in ids if row_id not in data[table_name]]
+        if missing:
+            raise KeyError(f"{table_name} has no rows {sorted_ids(missing)[:5]}")
+
+    # Downward: owned rows, parents before children
+    for table_name in TABLES:
+        for child_table, postings in index.children.get(table_name, []):
+            for row_id in selected[table_name]:
+                selected[child_table].update(postings.get(row_id, ()))
+
+    # Upward: referenced rows, referring tables before the tables they refer to
+    for table_name in reversed(TABLES):
+        rows = data[table_name]
+        for column, ref_table, condition in index.references.get(table_name, []):
+            wanted = selected[ref_table]
+            for row_id in selected[table_name]:
+                row = rows[row_id]
+                if condition is not None and row[condition[0]] != condition[1]:
+                    continue
+                if row[column] is not None:
+                    wanted.add(row[column])
+
+    return {
+        table_name: {row_id: data[table_name][row_id] for row_id in sorted_ids(ids)}
+        for table_name, ids in selected.items()
+    }
+
+if __name__ == "__main__":
+    from seeded2 import write_table
+
+    parser = argparse.ArgumentParser(description="Write a referentially closed subset of a generated dataset")
+    parser.add_argument('--clients', nargs='+', default=[], metavar='CLIENT_ID')
+    parser.add_argument('--incidents', nargs='+', default=[], metavar='INCIDENT_ID')
+    parser.add_argument('--detected-from', help="seed with incidents detected at or after this ISO time")
+    parser.add_argument('--detected-to',
+                        help="seed with incidents detected at or before this ISO time (a bare date includes that day)")
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--output-dir', required=True)
+    args = parser.parse_args()
+    if not (args.clients or args.incidents or args.detected_from or args.detected_to):
+        parser.error("give at least one seed: --clients, --incidents or a --detected-from/--detected-to window")
+
+    start = time.perf_counter()
+    index = SubsetIndex(load_data(data_dir=args.data_dir))
+    indexed = time.perf_counter()
+    tables = extract(index, args.clients, args.incidents, args.detected_from, args.detected_to)
+    extracted = time.perf_counter()
+    os.makedirs(args.output_dir, exist_ok=True)
+    for table_name, rows in tables.items():
+        write_table(table_name, rows, args.output_dir)
+        print(f"  {table_name}: {len(rows)} of {len(index.data[table_name])} rows")
+    print(f"{sum(len(rows) for rows in tables.values())} rows -> {args.output_dir} "
+          f"(load and index {indexed - start:.2f}s, extract {extracted - indexed:.3f}s)")
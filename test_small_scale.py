@@ -0,0 +1,26 @@
+"""Generation at small scale factors: every stage finishes and every foreign key resolves.
+
+At these scales the users stage draws only a handful of internal employees,
+so role pools (approvers, facilitators, ...) would come out empty or hold
+only the requester without its per-role minimum.
+
+    python -m pytest test_small_scale.py
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from dataset import load_data
+from validate_integrity import validate_integrity
+
+GENERATOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'seeded2.py')
+
+@pytest.mark.parametrize('scale, seed', [(0.01, 1), (0.02, 3), (0.05, 3)])
+def test_small_scale_generates_consistent_data(tmp_path, scale, seed):
+    subprocess.run([sys.executable, GENERATOR, '--seed', str(seed), '--scale', str(scale), '--output-dir', str(tmp_path)],
+                   cwd=tmp_path, check=True, capture_output=True, timeout=300)
+    failures = [result for result in validate_integrity(load_data(data_dir=str(tmp_path)))
+                if result['violations'] or result.get('missing_table')]
+    assert failures == []
@@ -0,0 +1,119 @@
+"""Inverted text index over incident, knowledge-base and change-request text.
+
+Titles come from a fixed vocabulary (titles_by_component, fallback_titles,
+"How to Handle {title}", "Emergency Fix for {title}", ...), so millions of
+rows share a few thousand distinct texts. The index exploits that: rows of
+a table with the same indexed field values form one document, each
+distinct text is tokenised once, and postings map a token to the
+documents containing it with a length-normalised term frequency.
+
+A query is scored over documents, not rows, with tf-idf (idf counts the
+rows containing a token) times the fraction of query tokens a document
+matched, and rows are read off the best documents until the limit is
+reached. A search therefore costs time in the number of matching distinct
+texts, whatever the number of rows.
+
+    python text_search.py "SFTP timeout" [--limit 20] [--data-dir DIR]
+"""
+import argparse
+import math
+import re
+import time
+
+# (table, columns searched in it)
+SOURCES = [
+    ('incidents', ('title', 'category')),
+    ('knowledge_base_articles', ('title', 'category')),
+    ('change_requests', ('title',)),
+]
+
+TOKEN = re.compile(r'[a-z0-9]+')
+
+def tokenize(text):
+    """Lower-cased alphanumeric tokens; underscores and punctuation separate them"""
+    return TOKEN.findall(text.lower()) if text else []
+
+def build_index(data, sources=SOURCES):
+    """Postings over the distinct documents of the given tables' text columns"""
+    documents = []
+    rows = []
+    document_ids = {}
+    for table_name, columns in sources:
+        for row_id, row in data[table_name].items():
+            key = (table_name,) + tuple(row[column] for column in columns)
+            document = document_ids.get(key)
+            if document is None:
+                document = document_ids[key] = len(documents)
+                documents.append(key)
+                rows.append([])
+            rows[document].append(row_id)
+
+    postings = {}
+    token_rows = {}
+    tokens_by_text = {}
+    for document, (table_name, *texts) in enumerate(documents):
+        tokens = []
+        for text in texts:
+            if text not in tokens_by_text:
+                tokens_by_text[text] = tokenize(text)
+            tokens.extend(tokens_by_text[text])
+        for token in set(tokens):
+            postings.setdefault(token, {})[document] = tokens.count(token) / len(tokens)
+            token_rows[token] = token_rows.get(token, 0) + len(rows[document])
+
+    row_count = sum(len(document_rows) for document_rows in rows)
+    return {
+        'documents': documents,
+        'rows': rows,
+        'postings': postings,
+        'idf': {token: math.log(1 + row_count / count) for token, count in token_rows.items()},
+    }
+
+def search(index, query, limit=20, tables=None):
+    """[(score, table, row_id)] best first; tables restricts the result to some tables"""
+    terms = set(tokenize(query))
+    scores = {}
+    matched = {}
+    for term in terms:
+        idf = index['idf'].get(term)
+        if idf is None:
+            continue
+        for document, weight in index['postings'][term].items():
+            scores[document] = scores.get(document, 0.0) + weight * idf
+            matched[document] = matched.get(document, 0) + 1
+
+    ranked = sorted(((score * matched[document] / len(terms), document) for document, score in scores.items()),
+                    key=lambda item: (-item[0], item[1]))
+    results = []
+    for score, document in ranked:
+        table_name = index['documents'][document][0]
+        if tables is not None and table_name not in tables:
+            continue
+        for row_id in index['rows'][document]:
+            if len(results) == limit:
+                return results
+            results.append((round(score, 4), table_name, row_id))
+    return results
+
+if __name__ == "__main__":
+    from dataset import DATA_DIR, load_data
+
+    parser = argparse.ArgumentParser(description="Ranked search over incident, KB and change-request text")
+    parser.add_argument('query')
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--tables', nargs='+', help="only return rows from these tables")
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    args = parser.parse_args()
+
+    data = load_data([table_name for table_name, _ in SOURCES], data_dir=args.data_dir)
+    start = time.perf_counter()
+    index = build_index(data)
+    indexed = time.perf_counter()
+    results = search(index, args.query, args.limit, args.tables)
+    searched = time.perf_counter()
+    columns = dict(SOURCES)
+    for score, table_name, row_id in results:
+        row = data[table_name][row_id]
+        print(f"{score:.3f}\t{table_name}\t{row_id}\t" + ' | '.join(str(row[column]) for column in columns[table_name]))
+    print(f"{len(results)} results (index {len(index['documents'])} documents in {indexed - start:.3f}s, "
+          f"search {(searched - indexed) * 1000:.2f} ms)")
@@ -0,0 +1,213 @@
+"""Referential-integrity and key-uniqueness validator for the generated tables.
+
+Every referenced key set is built once (plain primary-key references reuse
+the table dict's keys directly), then each table is scanned once with all of
+its foreign-key, primary-key and natural-key checks applied to each row, in
+the manner of a hash join. Null references are allowed; everything else that
+fails a lookup is a violation.
+
+    python validate_integrity.py [data_dir]
+
+exits non-zero when any check has violations.
+"""
+import sys
+import time
+from operator import itemgetter
+
+from dataset import DATA_DIR, PRIMARY_KEYS, TABLES, load_data
+
+# (table, column(s), referenced table, referenced column(s))
+FOREIGN_KEYS = [
+    ('users', 'client_id', 'clients', 'client_id'),
+    ('users', 'vendor_id', 'vendors', 'vendor_id'),
+    ('products', 'vendor_support_id', 'vendors', 'vendor_id'),
+    ('infrastructure_components', 'product_id', 'products', 'product_id'),
+    ('client_subscriptions', 'client_id', 'clients', 'client_id'),
+    ('client_subscriptions', 'product_id', 'products', 'product_id'),
+    ('sla_agreements', 'subscription_id', 'client_subscriptions', 'subscription_id'),
+    ('incidents', 'reporter_id', 'users', 'user_id'),
+    ('incidents', 'assigned_manager_id', 'users', 'user_id'),
+    ('incidents', 'client_id', 'clients', 'client_id'),
+    ('incidents', 'component_id', 'infrastructure_components', 'component_id'),
+    ('workarounds', 'incident_id', 'incidents', 'incident_id'),
+    ('workarounds', 'implemented_by_id', 'users', 'user_id'),
+    ('root_cause_analysis', 'incident_id', 'incidents', 'incident_id'),
+    ('root_cause_analysis', 'conducted_by_id', 'users', 'user_id'),
+    ('communications', 'incident_id', 'incidents', 'incident_id'),
+    ('communications', 'sender_id', 'users', 'user_id'),
+    ('communications', 'recipient_id', 'users', 'user_id'),
+    ('incident_updates', 'incident_id', 'incidents', 'incident_id'),
+    ('incident_updates', 'updated_by_id', 'users', 'user_id'),
+    ('escalations', 'incident_id', 'incidents', 'incident_id'),
+    ('escalations', 'escalated_by_id', 'users', 'user_id'),
+    ('escalations', 'escalated_to_id', 'users', 'user_id'),
+    ('change_requests', 'incident_id', 'incidents', 'incident_id'),
+    ('change_requests', 'requested_by_id', 'users', 'user_id'),
+    ('change_requests', 'approved_by_id', 'users', 'user_id'),
+    ('rollback_requests', 'change_id', 'change_requests', 'change_id'),
+    ('rollback_requests', 'incident_id', 'incidents', 'incident_id'),
+    ('rollback_requests', ('change_id', 'incident_id'), 'change_requests', ('change_id', 'incident_id')),
+    ('rollback_requests', 'requested_by_id', 'users', 'user_id'),
+    ('rollback_requests', 'approved_by_id', 'users', 'user_id'),
+    ('metrics', 'incident_id', 'incidents', 'incident_id'),
+    ('incident_reports', 'incident_id', 'incidents', 'incident_id'),
+    ('incident_reports', 'generated_by_id', 'users', 'user_id'),
+    ('knowledge_base_articles', 'incident_id', 'incidents', 'incident_id'),
+    ('knowledge_base_articles', 'created_by_id', 'users', 'user_id'),
+    ('knowledge_base_articles', 'reviewed_by_id', 'users', 'user_id'),
+    ('post_incident_reviews', 'incident_id', 'incidents', 'incident_id'),
+    ('post_incident_reviews', 'facilitator_id', 'users', 'user_id'),
+]
+
+# Polymorphic references: only checked on rows where condition column == value
+# (table, column, referenced table, referenced column, (condition column, value))
+CONDITIONAL_FOREIGN_KEYS = [
+    ('incident_updates', 'new_value', 'workarounds', 'workaround_id', ('field_name', 'workaround_id')),
+    ('incident_updates', 'new_value', 'communications', 'communication_id', ('field_name', 'communication_id')),
+    ('incident_updates', 'new_value', 'users', 'user_id', ('field_name', 'assigned_manager_id')),
+    ('incident_updates', 'old_value', 'users', 'user_id', ('field_name', 'assigned_manager_id')),
+]
+
+# Natural keys the generator guarantees to be unique
+UNIQUE_KEYS = [
+    ('clients', 'client_name'),
+    ('clients', 'registration_number'),
+    ('clients', 'contact_email'),
+    ('clients', 'contact_phone'),
+    ('vendors', 'vendor_name'),
+    ('vendors', 'contact_email'),
+    ('vendors', 'contact_phone'),
+    ('products', 'product_name'),
+    ('sla_agreements', ('subscription_id', 'severity_level')),
+]
+
+SAMPLE_SIZE = 5
+
+def as_tuple(columns):
+    return columns if isinstance(columns, tuple) else (columns,)
+
+def key_getter(columns):
+    """Row -> key value (a tuple for composite keys)"""
+    return itemgetter(*as_tuple(columns))
+
+def describe(columns):
+    return '(' + ', '.join(columns) + ')' if isinstance(columns, tuple) else columns
+
+def referenced_keys(data, table_name, columns, cache):
+    """Set of key values present in the referenced table, built once per (table, columns)"""
+    cache_key = (table_name, as_tuple(columns))
+    if cache_key not in cache:
+        rows = data[table_name]
+        if columns == PRIMARY_KEYS[table_name]:
+            # Dict keys are the primary keys (checked separately), so no copy is needed
+            cache[cache_key] = rows.keys()
+        else:
+            get_key = key_getter(columns)
+            cache[cache_key] = {get_key(row) for row in rows.values()}
+    return cache[cache_key]
+
+def new_result(check, name):
+    return {'check': check, 'name': name, 'rows_checked': 0, 'violations': 0, 'sample': []}
+
+def record(result, row_id, value):
+    result['violations'] += 1
+    if len(result['sample']) < SAMPLE_SIZE:
+        result['sample'].append({'row_id': row_id, 'value': value})
+
+def validate_table(data, table_name, key_cache):
+    """Run every check that applies to one table in a single pass over its rows"""
+    pk = PRIMARY_KEYS[table_name]
+    results = []
+
+    pk_result = new_result('primary_key', f"{table_name}.{pk}")
+    results.append(pk_result)
+
+    # (result, key getter, referenced keys, condition getter, condition value, composite)
+    fk_checks = []
+    for table, columns, ref_table, ref_columns in FOREIGN_KEYS:
+        if table != table_name:
+            continue
+        result = new_result('foreign_key', f"{table}.{describe(columns)} -> {ref_table}.{describe(ref_columns)}")
+        if ref_table not in data:
+            result['missing_table'] = ref_table
+        else:
+            fk_checks.append((result, key_getter(columns), referenced_keys(data, ref_table, ref_columns, key_cache),
+                              None, None, isinstance(columns, tuple)))
+        results.append(result)
+    for table, column, ref_table, ref_column, (cond_column, cond_value) in CONDITIONAL_FOREIGN_KEYS:
+        if table != table_name:
+            continue
+        result = new_result('foreign_key', f"{table}.{column} -> {ref_table}.{ref_column} where {cond_column} = '{cond_value}'")
+        if ref_table not in data:
+            result['missing_table'] = ref_table
+        else:
+            fk_checks.append((result, key_getter(column), referenced_keys(data, ref_table, ref_column, key_cache),
+                              itemgetter(cond_column), cond_value, False))
+        results.append(result)
+
+    unique_checks = []
+    for table, columns in UNIQUE_KEYS:
+        if table == table_name:
+            result = new_result('unique', f"{table}.{describe(columns)}")
+            unique_checks.append((result, key_getter(columns), {}))
+            results.append(result)
+
+    for row_id, row in data[table_name].items():
+        if row.get(pk) != row_id:
+            record(pk_result, row_id, row.get(pk))
+
+        for result, get_key, ref_keys, get_cond, cond_value, composite in fk_checks:
+            if get_cond is not None and get_cond(row) != cond_value:
+                continue
+            value = get_key(row)
+            if value is None or (composite and None in value):
+                continue
+            result['rows_checked'] += 1
+            if value not in ref_keys:
+                record(result, row_id, value)
+
+        for result, get_key, seen in unique_checks:
+            value = get_key(row)
+            if value in seen:
+                record(result, row_id, {'value': value, 'first_row_id': seen[value]})
+            else:
+                seen[value] = row_id
+
+    n_rows = len(data[table_name])
+    pk_result['rows_checked'] = n_rows
+    for result, _, _ in unique_checks:
+        result['rows_checked'] = n_rows
+
+    return results
+
+def validate_integrity(data):
+    """Validate every loaded table; returns a list of check results"""
+    key_cache = {}
+    results = []
+    for table_name in TABLES:
+        if table_name in data:
+            results.extend(validate_table(data, table_name, key_cache))
+    return results
+
+def print_report(results):
+    for result in results:
+        marker = 'FAIL' if result['violations'] or result.get('missing_table') else 'ok  '
+        print(f"{marker} {result['name']}: {result['violations']} violations in {result['rows_checked']} rows")
+        if result.get('missing_table'):
+            print(f"       referenced table {result['missing_table']} is missing")
+        for sample in result['sample']:
+            print(f"       row {sample['row_id']}: {sample['value']!r}")
+
+if __name__ == "__main__":
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else DATA_DIR
+    start = time.perf_counter()
+    data = load_data(data_dir=data_dir)
+    loaded = time.perf_counter()
+    results = validate_integrity(data)
+    checked = time.perf_counter()
+
+    print_report(results)
+    failures = [r for r in results if r['violations'] or r.get('missing_table')]
+    print(f"\n{len(results)} checks, {len(failures)} failing "
+          f"(load {loaded - start:.2f}s, validate {checked - loaded:.2f}s)")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,197 @@
+"""Vectorised temporal-invariant checks for the generated tables.
+
+Every timestamp column a rule touches is converted once to a float64 epoch
+array (nulls become NaN, so comparisons involving a missing value never
+count as violations). Rules are then evaluated as whole-array comparisons:
+
+  order   -- within a row, one timestamp must not precede another
+  window  -- a child row's timestamp must fall inside its parent's window
+  cutoff  -- no timestamp may pass the dataset's as-of date (seeded2.py's
+             Aug 31, 2025 cap), apart from columns that are meant to
+             point into the future
+
+    python validate_temporal.py [data_dir] [--cutoff 2025-08-31T23:59:59]
+"""
+import argparse
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from dataset import DATA_DIR, epoch_column, load_data, to_epoch
+from seeded2 import REFERENCE_DATE
+
+# The generator's cap, so the two cannot drift apart
+CUTOFF = REFERENCE_DATE
+
+# (table, earlier column, later column)
+ORDER_RULES = [
+    ('incidents', 'detected_at', 'created_at'),
+    ('incidents', 'detected_at', 'resolved_at'),
+    ('incidents', 'resolved_at', 'closed_at'),
+    ('incidents', 'created_at', 'updated_at'),
+    ('escalations', 'escalated_at', 'acknowledged_at'),
+    ('escalations', 'acknowledged_at', 'resolved_at'),
+    ('change_requests', 'scheduled_start', 'scheduled_end'),
+    ('change_requests', 'actual_start', 'actual_end'),
+    ('client_subscriptions', 'start_date', 'end_date'),
+    ('clients', 'created_at', 'updated_at'),
+    ('users', 'created_at', 'updated_at'),
+    ('products', 'created_at', 'updated_at'),
+    ('infrastructure_components', 'created_at', 'updated_at'),
+    ('client_subscriptions', 'created_at', 'updated_at'),
+    ('change_requests', 'created_at', 'updated_at'),
+    ('knowledge_base_articles', 'created_at', 'updated_at'),
+]
+
+# (table, column, parent table, foreign key, parent lower bound, parent upper bound or None)
+WINDOW_RULES = [
+    ('incident_updates', 'created_at', 'incidents', 'incident_id', 'created_at', 'updated_at'),
+    ('workarounds', 'implemented_at', 'incidents', 'incident_id', 'created_at', 'updated_at'),
+    ('communications', 'sent_at', 'incidents', 'incident_id', 'created_at', 'updated_at'),
+    ('escalations', 'escalated_at', 'incidents', 'incident_id', 'created_at', 'updated_at'),
+    ('metrics', 'recorded_at', 'incidents', 'incident_id', 'created_at', 'updated_at'),
+    ('root_cause_analysis', 'completed_at', 'incidents', 'incident_id', 'created_at', 'updated_at'),
+    ('incident_reports', 'generated_at', 'incidents', 'incident_id', 'created_at', None),
+    ('post_incident_reviews', 'scheduled_date', 'incidents', 'incident_id', 'resolved_at', None),
+    ('rollback_requests', 'executed_at', 'change_requests', 'change_id', 'created_at', None),
+]
+
+# Timestamp columns per table that must not pass the cutoff
+CUTOFF_COLUMNS = {
+    'clients': ['created_at', 'updated_at'],
+    'vendors': ['created_at'],
+    'users': ['created_at', 'updated_at'],
+    'products': ['created_at', 'updated_at'],
+    'infrastructure_components': ['created_at', 'updated_at'],
+    # end_date is allowed to run past the cutoff for active/suspended subscriptions
+    'client_subscriptions': ['start_date', 'created_at', 'updated_at'],
+    'sla_agreements': ['created_at'],
+    'incidents': ['detected_at', 'resolved_at', 'closed_at', 'created_at', 'updated_at'],
+    'workarounds': ['implemented_at', 'created_at'],
+    'root_cause_analysis': ['completed_at', 'created_at'],
+    'communications': ['sent_at', 'created_at'],
+    'incident_updates': ['created_at'],
+    'escalations': ['escalated_at', 'acknowledged_at', 'resolved_at', 'created_at'],
+    'change_requests': ['scheduled_start', 'scheduled_end', 'actual_start', 'actual_end', 'created_at', 'updated_at'],
+    'rollback_requests': ['executed_at', 'created_at'],
+    'metrics': ['recorded_at', 'created_at'],
+    'incident_reports': ['generated_at', 'created_at'],
+    'knowledge_base_articles': ['created_at', 'updated_at'],
+    # PIRs are scheduled days after the incident ends, so they may be in the future
+    'post_incident_reviews': ['created_at'],
+}
+
+SAMPLE_SIZE = 5
+
+def column_cache(data):
+    """Lazily build and memoise epoch arrays per (table, column)"""
+    cache = {}
+
+    def get(table_name, column):
+        key = (table_name, column)
+        if key not in cache:
+            cache[key] = epoch_column(data[table_name], column)[1]
+        return cache[key]
+
+    return get
+
+def violation(rule, kind, table_ids, checked, failing):
+    """Build a rule result from a boolean mask of violating rows"""
+    positions = np.flatnonzero(failing)
+    return {
+        'rule': rule,
+        'kind': kind,
+        'rows_checked': int(checked),
+        'violations': len(positions),
+        'row_ids': [table_ids[i] for i in positions],
+    }
+
+def check_order(data, column, rules=ORDER_RULES):
+    results = []
+    for table_name, earlier, later in rules:
+        if table_name not in data:
+            continue
+        ids = list(data[table_name])
+        a = column(table_name, earlier)
+        b = column(table_name, later)
+        checked = np.count_nonzero(~np.isnan(a) & ~np.isnan(b))
+        results.append(violation(f"{table_name}: {earlier} <= {later}", 'order', ids, checked, b < a))
+    return results
+
+def check_windows(data, column, rules=WINDOW_RULES):
+    results = []
+    positions_by_parent = {}
+    for table_name, child_column, parent_table, fk, lo_column, hi_column in rules:
+        if table_name not in data or parent_table not in data:
+            continue
+        if parent_table not in positions_by_parent:
+            positions_by_parent[parent_table] = {row_id: i for i, row_id in enumerate(data[parent_table])}
+        parent_position = positions_by_parent[parent_table]
+
+        ids = list(data[table_name])
+        child = column(table_name, child_column)
+        parent = np.fromiter(
+            (parent_position.get(row[fk], -1) for row in data[table_name].values()),
+            dtype=np.int64, count=len(ids)
+        )
+        has_parent = parent >= 0
+        # Rows with a dangling parent are the integrity validator's business
+        parent = np.where(has_parent, parent, 0)
+
+        lo = column(parent_table, lo_column)[parent]
+        failing = has_parent & (child < lo)
+        rule = f"{table_name}.{child_column} >= {parent_table}.{lo_column}"
+        if hi_column is not None:
+            hi = column(parent_table, hi_column)[parent]
+            failing |= has_parent & (child > hi)
+            rule = f"{parent_table}.{lo_column} <= {table_name}.{child_column} <= {parent_table}.{hi_column}"
+        checked = np.count_nonzero(has_parent & ~np.isnan(child))
+        results.append(violation(rule, 'window', ids, checked, failing))
+    return results
+
+def check_cutoff(data, column, cutoff=CUTOFF, columns_by_table=CUTOFF_COLUMNS):
+    results = []
+    limit = to_epoch(cutoff)
+    for table_name, columns in columns_by_table.items():
+        if table_name not in data:
+            continue
+        ids = list(data[table_name])
+        for name in columns:
+            values = column(table_name, name)
+            checked = np.count_nonzero(~np.isnan(values))
+            results.append(violation(f"{table_name}.{name} <= {cutoff}", 'cutoff', ids, checked, values > limit))
+    return results
+
+def validate_temporal(data, cutoff=CUTOFF):
+    """Evaluate every rule against the loaded tables; returns one result per rule"""
+    column = column_cache(data)
+    return check_order(data, column) + check_windows(data, column) + check_cutoff(data, column, cutoff)
+
+def print_report(results):
+    for result in results:
+        marker = 'FAIL' if result['violations'] else 'ok  '
+        print(f"{marker} [{result['kind']}] {result['rule']}: "
+              f"{result['violations']} violations in {result['rows_checked']} rows")
+        if result['violations']:
+            print(f"       rows {', '.join(result['row_ids'][:SAMPLE_SIZE])}"
+                  f"{' ...' if result['violations'] > SAMPLE_SIZE else ''}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('data_dir', nargs='?', default=DATA_DIR)
+    parser.add_argument('--cutoff', default=CUTOFF.isoformat())
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    data = load_data(data_dir=args.data_dir)
+    loaded = time.perf_counter()
+    results = validate_temporal(data, datetime.fromisoformat(args.cutoff))
+    checked = time.perf_counter()
+
+    print_report(results)
+    failures = [r for r in results if r['violations']]
+    print(f"\n{len(results)} rules, {len(failures)} failing "
+          f"(load {loaded - start:.2f}s, check {checked - loaded:.2f}s)")
+    sys.exit(1 if failures else 0)